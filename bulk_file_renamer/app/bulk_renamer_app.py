@@ -16,15 +16,13 @@ import json
 from collections import deque
 from datetime import datetime
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QProgressBar, QFileDialog, QMessageBox, QTabWidget, QMainWindow, QHBoxLayout, QLabel
-from PySide6.QtGui import QColor, QIcon
+from PySide6.QtGui import QIcon
 from PySide6.QtCore import Qt, QTimer
 from app.ui.top_panel import TopPanel
-from app.ui.file_count_row import FileCountRow
-from app.ui.history_panel import HistoryPanel
 from app.ui.settings_tab import SettingsTab
 from app.ui.menu_bar import MenuBar
 from app.ui.custom_notification_bar import CustomNotificationManager
-from app.utils.generate_preview import generate_preview
+from app.utils.generate_preview import generate_preview, STATUS_TEXT
 from app.utils.profile_manager import ProfileManager
 from app.utils.settings_manager import SettingsManager
 from app.utils.translation_manager import get_translation_manager, set_language
@@ -57,7 +55,8 @@ class BulkRenamerApp(QMainWindow):
         self.filtered_files = []
         self.history = []
         self.profile_manager = ProfileManager()
-        self.settings_manager = SettingsManager()
+        # Changes are written in the background once they settle for a second
+        self.settings_manager = SettingsManager(autosave_delay=1.0)
         self.notification_manager = CustomNotificationManager(self)
         
         # Initialize translation manager
@@ -198,6 +197,8 @@ class BulkRenamerApp(QMainWindow):
         )
         self._lang_overlay.hide()
         
+        # Run any preview scheduled during startup while still flagged as initial load
+        self.top_panel.flush_pending_preview()
         # Mark initial load as complete
         self._is_initial_load = False
         
@@ -233,23 +234,14 @@ class BulkRenamerApp(QMainWindow):
 
     # ---------------- Preview ----------------
     def update_preview(self):
-        # Get full list; TopPanel handles lazy rendering in batches
+        # Get full list; the preview table model only renders visible rows
         preview_list = self.get_preview_list()
 
-        # Apply status filter (index-based to avoid translation mismatches)
-        status_idx = self.top_panel.status_filter.currentIndex()
-        if status_idx > 0:
-            # Map fixed indices to internal status codes used by preview
-            # 1: Ready, 2: Conflict, 3: No Change, 4: Extension Locked
-            status_map = {
-                1: "Ready",
-                2: "Conflict",
-                3: "No Change",
-                4: "Extension Locked",
-            }
-            wanted = status_map.get(status_idx)
-            if wanted:
-                preview_list = [f for f in preview_list if f[2] == wanted]
+        # Apply status filter (item data is a Status code, None for "All")
+        wanted = self.top_panel.status_filter.currentData()
+        if wanted is not None:
+            wanted_text = STATUS_TEXT[wanted]
+            preview_list = [f for f in preview_list if f[2] == wanted_text]
 
         # Update empty overlay state before rendering
         try:
@@ -291,36 +283,8 @@ class BulkRenamerApp(QMainWindow):
             pass
 
         self.top_panel.update_preview(preview_list)
-        self._color_preview(preview_list)
         self.top_panel.file_count.update_count(len(self.selected_files), len(self.filtered_files))
 
-    def _color_preview(self, preview_list):
-        show_tooltips = bool(self.settings_manager.get("show_tooltips", True))
-        for row, (_, new_name, status, _) in enumerate(preview_list):
-            color = QColor("black")
-            tooltip = ""
-            if status == "Ready":
-                color = QColor("green")
-                tooltip = self.translation_manager.tr("ui.status_ready_tooltip") if show_tooltips else ""
-            elif status == "Conflict":
-                color = QColor("red")
-                tooltip = self.translation_manager.tr("ui.status_conflict_tooltip") if show_tooltips else ""
-            elif status == "No Change":
-                color = QColor("red")
-                tooltip = self.translation_manager.tr("ui.status_no_change_tooltip") if show_tooltips else ""
-            elif status == "Extension Locked":
-                color = QColor(255, 140, 0)  # Orange color
-                tooltip = self.translation_manager.tr("ui.status_extension_locked_tooltip") if show_tooltips else ""
-
-            item = self.top_panel.table.item(row, 1)
-            if item:
-                item.setForeground(color)
-                # Apply or clear tooltip based on setting
-                try:
-                    item.setToolTip(tooltip if show_tooltips else "")
-                except Exception:
-                    pass
-
     def get_preview_list(self):
         prefix = self.top_panel.prefix_input.text().strip()
         suffix = self.top_panel.suffix_input.text().strip()
@@ -566,7 +530,7 @@ class BulkRenamerApp(QMainWindow):
                 self.selected_files = [f for f in self.selected_files if f not in renamed_old_paths]
 
                 self.history.append({"files": successes, "undone": False})
-                self.top_panel.history_panel.update_history(self.history)
+                self.top_panel.update_history(self.history)
                 self.top_panel.undo_button.setEnabled(True)
                 
                 # Save history to file
@@ -632,7 +596,7 @@ class BulkRenamerApp(QMainWindow):
                 self.selected_files.extend(restored_paths)
 
             last_batch["undone"] = True
-            self.top_panel.history_panel.update_history(self.history)
+            self.top_panel.update_history(self.history)
             self.top_panel.undo_button.setEnabled(any(not b.get("undone", False) for b in self.history))
             self.update_preview()
             
@@ -667,7 +631,7 @@ class BulkRenamerApp(QMainWindow):
         """Undo all selected history batches from the HistoryPanel."""
         checked_indices = []
         try:
-            checked_indices = self.top_panel.history_panel.get_checked_indices()
+            checked_indices = self.top_panel.get_checked_history_indices()
         except Exception:
             checked_indices = []
         if not checked_indices:
@@ -707,7 +671,7 @@ class BulkRenamerApp(QMainWindow):
             for idx in checked_indices:
                 if 0 <= idx < len(self.history):
                     self.history[idx]["undone"] = True
-            self.top_panel.history_panel.update_history(self.history)
+            self.top_panel.update_history(self.history)
             self.top_panel.undo_button.setEnabled(any(not b.get("undone", False) for b in self.history))
             self.update_preview()
             
@@ -808,18 +772,26 @@ class BulkRenamerApp(QMainWindow):
 
         # Always use the current selected_files to check for duplicates
         self._file_add_worker = FileAddWorker(paths, existing_files=self.selected_files)
+        added_count = 0
 
-        def on_finished(new_files, duplicate_count):
+        def on_chunk(new_files):
+            # Large folders arrive in batches; the preview is rebuilt once at the end
+            nonlocal added_count
+            added_count += len(new_files)
             self.selected_files.extend(new_files)
+
+        def on_finished(new_files, duplicate_count):
+            on_chunk(new_files)
             self.update_preview()
             
             # Show notification if there were duplicates
             if duplicate_count > 0:
-                self._show_duplicate_notification(len(new_files), duplicate_count)
+                self._show_duplicate_notification(added_count, duplicate_count)
             
             self._process_file_add_queue()
 
         self._file_add_worker.progress.connect(self.progress_bar.setValue)
+        self._file_add_worker.chunk.connect(on_chunk)
         self._file_add_worker.finished.connect(on_finished)
         self._file_add_worker.start()
     
@@ -911,12 +883,9 @@ class BulkRenamerApp(QMainWindow):
         if "_metadata" in profile_data:
             del profile_data["_metadata"]
         
-        # Apply settings
+        # Apply settings (refreshes the preview once)
         self.top_panel.apply_settings(profile_data)
         
-        # Update preview
-        self.update_preview()
-        
         self.notification_manager.show_notification(
             self.translation_manager.tr("notifications.profile_loaded", name=profile_name), 
             "load"
@@ -1491,7 +1460,7 @@ class BulkRenamerApp(QMainWindow):
     def toggle_history(self):
         """Toggle history panel display."""
         show_history = self.menu_bar.actions['toggle_history'].isChecked()
-        self.top_panel.history_panel.setVisible(show_history)
+        self.top_panel.set_history_visible(show_history)
     
     def update_recent_items(self):
         """Update recent profiles in menu."""
@@ -1513,7 +1482,7 @@ class BulkRenamerApp(QMainWindow):
         
         # History visibility
         show_history = self.settings_manager.get("show_history", True)
-        self.top_panel.history_panel.setVisible(show_history)
+        self.top_panel.set_history_visible(show_history)
         self.menu_bar.actions['toggle_history'].setChecked(show_history)
         
         # Tooltips
@@ -1539,10 +1508,12 @@ class BulkRenamerApp(QMainWindow):
             apply_theme(self, app_theme)
         # Update history panel theme
         if app_theme:
-            self.top_panel.history_panel.update_theme(app_theme)
+            self.top_panel.update_history_theme(app_theme)
         # Update start number styling after theme is applied (use QTimer to ensure it's last)
         from PySide6.QtCore import QTimer
         QTimer.singleShot(0, self.top_panel._update_start_number_styling)
+        # Refresh the preview for the applied values before notifications are re-enabled
+        self.top_panel.flush_pending_preview()
         
         # Reset flag after settings are applied
         self._is_applying_settings = False
@@ -1566,7 +1537,7 @@ class BulkRenamerApp(QMainWindow):
                     self.history = json.load(f)
                 # Update UI with loaded history
                 if self.history:
-                    self.top_panel.history_panel.update_history(self.history)
+                    self.top_panel.update_history(self.history)
                     self.top_panel.undo_button.setEnabled(any(not b.get("undone", False) for b in self.history))
         except Exception as e:
             # Silently fail - start with empty history
@@ -1633,8 +1604,9 @@ class BulkRenamerApp(QMainWindow):
         # Update file count row
         self.top_panel.file_count.update_language()
         
-        # Update history panel
-        self.top_panel.history_panel.update_language()
+        # Update history panel (built panels only; a new one starts translated)
+        if self.top_panel.has_history_panel():
+            self.top_panel.history_panel.update_language()
         
         # Update settings tab
         self.settings_tab.update_language()
@@ -12,8 +12,8 @@
 # permission from the copyright holder.
 
 from PySide6.QtWidgets import QCheckBox, QStyle, QStyleOptionButton
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPainter, QPen, QBrush, QColor
+from PySide6.QtCore import Qt, QPoint
+from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QPolygon
 
 
 class CustomCheckBox(QCheckBox):
@@ -24,20 +24,30 @@ class CustomCheckBox(QCheckBox):
         self.check_color = "#1E63E9"  # Default to blue (light theme)
         self.border_color = "#D5D5D5"  # Default border color
         self.background_color = "#FFFFFF"  # Default background color
+        self._resolve_paint()
+    
+    def _resolve_paint(self):
+        """Build the brush and pens from the color strings once per theme change, not per paint."""
+        self._bg_brush = QBrush(QColor(self.background_color))
+        self._border_pen = QPen(QColor(self.border_color), 1)
+        self._check_pen = QPen(QColor(self.check_color), 2)
     
     def set_check_color(self, color):
         """Set the check mark color for theming."""
         self.check_color = color
+        self._resolve_paint()
         self.update()  # Trigger repaint
     
     def set_border_color(self, color):
         """Set the border color for theming."""
         self.border_color = color
+        self._resolve_paint()
         self.update()  # Trigger repaint
     
     def set_background_color(self, color):
         """Set the background color for theming."""
         self.background_color = color
+        self._resolve_paint()
         self.update()  # Trigger repaint
     
     def paintEvent(self, event):
@@ -60,18 +70,15 @@ class CustomCheckBox(QCheckBox):
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Draw checkbox background
-        bg_brush = QBrush(QColor(self.background_color))
-        border_pen = QPen(QColor(self.border_color), 1)
-        painter.setBrush(bg_brush)
-        painter.setPen(border_pen)
+        painter.setBrush(self._bg_brush)
+        painter.setPen(self._border_pen)
         
         # Draw rounded rectangle for checkbox
         painter.drawRoundedRect(indicator_rect, 3, 3)
         
         # Draw check mark if checked
         if self.isChecked():
-            check_pen = QPen(QColor(self.check_color), 2)
-            painter.setPen(check_pen)
+            painter.setPen(self._check_pen)
             painter.setBrush(Qt.NoBrush)
             
             # Draw check mark (simple V shape)
@@ -87,9 +94,7 @@ class CustomCheckBox(QCheckBox):
             ]
             
             # Draw the check mark
-            from PySide6.QtCore import QPoint
             check_points = [QPoint(x, y) for x, y in points]
-            from PySide6.QtGui import QPolygon
             painter.drawPolyline(QPolygon(check_points))
         
         painter.end()
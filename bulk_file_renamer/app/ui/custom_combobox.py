@@ -12,8 +12,8 @@
 # permission from the copyright holder.
 
 from PySide6.QtWidgets import QComboBox, QStyle, QStyleOptionComboBox
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPainter, QPen, QBrush, QColor
+from PySide6.QtCore import Qt, QPoint
+from PySide6.QtGui import QPainter, QBrush, QColor, QPolygon
 
 
 class CustomComboBox(QComboBox):
@@ -22,12 +22,14 @@ class CustomComboBox(QComboBox):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.arrow_color = "#000000"  # Default to black (light theme)
+        self._arrow_brush = QBrush(QColor(self.arrow_color))  # Rebuilt only when the color changes
         # Disable mouse wheel scrolling to avoid accidental changes when scrolling the page
         self.setFocusPolicy(Qt.StrongFocus)
     
     def set_arrow_color(self, color):
         """Set the arrow color for theming."""
         self.arrow_color = color
+        self._arrow_brush = QBrush(QColor(color))
         self.update()  # Trigger repaint
     
     def paintEvent(self, event):
@@ -51,10 +53,8 @@ class CustomComboBox(QComboBox):
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Set arrow color
-        pen = QPen(Qt.NoPen)
-        brush = QBrush(QColor(self.arrow_color))
-        painter.setPen(pen)
-        painter.setBrush(brush)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._arrow_brush)
         
         # Calculate triangle points (downward pointing)
         center_x = button_rect.center().x()
@@ -69,9 +69,7 @@ class CustomComboBox(QComboBox):
         ]
         
         # Draw the triangle
-        from PySide6.QtCore import QPoint
         triangle_points = [QPoint(x, y) for x, y in points]
-        from PySide6.QtGui import QPolygon
         painter.drawPolygon(QPolygon(triangle_points))
         
         painter.end()
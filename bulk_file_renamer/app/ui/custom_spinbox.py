@@ -12,7 +12,7 @@
 # permission from the copyright holder.
 
 from PySide6.QtWidgets import QSpinBox, QStyle, QStyleOptionSpinBox
-from PySide6.QtCore import Qt, QRect
+from PySide6.QtCore import Qt, QRect, QPoint
 from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QPolygon
 
 
@@ -26,10 +26,18 @@ class CustomSpinBox(QSpinBox):
         self.button_border_color = "#D5D5D5"
         self.hover_bg_color = "#F3F4F6"
         self.hover_border_color = "#1E63E9"
+        self._resolve_paint()
+    
+    def _resolve_paint(self):
+        """Build the button brush and pens from the color strings once per theme change, not per paint."""
+        self._button_brush = QBrush(QColor(self.button_bg_color))
+        self._button_pen = QPen(QColor(self.button_border_color), 1)
+        self._arrow_pen = QPen(QColor(self.arrow_color), 2)
     
     def set_arrow_color(self, color):
         """Set the arrow color for theming."""
         self.arrow_color = color
+        self._resolve_paint()
         self.update()
     
     def set_button_colors(self, bg_color, border_color, hover_bg_color, hover_border_color):
@@ -38,6 +46,7 @@ class CustomSpinBox(QSpinBox):
         self.button_border_color = border_color
         self.hover_bg_color = hover_bg_color
         self.hover_border_color = hover_border_color
+        self._resolve_paint()
         self.update()
     
     def paintEvent(self, event):
@@ -86,21 +95,16 @@ class CustomSpinBox(QSpinBox):
         # Determine colors based on hover state
         # For simplicity, we'll use the normal colors
         # In a more advanced implementation, you could track mouse position
-        bg_color = self.button_bg_color
-        border_color = self.button_border_color
         
         # Draw button background
-        bg_brush = QBrush(QColor(bg_color))
-        border_pen = QPen(QColor(border_color), 1)
-        painter.setBrush(bg_brush)
-        painter.setPen(border_pen)
+        painter.setBrush(self._button_brush)
+        painter.setPen(self._button_pen)
         
         # Draw rounded rectangle for button
         painter.drawRoundedRect(rect, 2, 2)
         
         # Draw arrow
-        arrow_pen = QPen(QColor(self.arrow_color), 2)
-        painter.setPen(arrow_pen)
+        painter.setPen(self._arrow_pen)
         painter.setBrush(Qt.NoBrush)
         
         # Calculate arrow size and position
@@ -142,6 +146,5 @@ class CustomSpinBox(QSpinBox):
                 ]
         
         # Convert to QPoint and draw
-        from PySide6.QtCore import QPoint
         arrow_points = [QPoint(x, y) for x, y in points]
         painter.drawPolygon(QPolygon(arrow_points))
@@ -56,6 +56,8 @@ class MenuBar(QMenuBar):
         # Recent Profiles submenu
         recent_profiles_menu = file_menu.addMenu(self.tr_manager.get_menu_text("recent_profiles"))
         self.recent_profiles_menu = recent_profiles_menu
+        # One handler for all entries; each action carries its profile name as data
+        recent_profiles_menu.triggered.connect(self._on_recent_profile_triggered)
         
         file_menu.addSeparator()
         
@@ -214,15 +216,22 @@ class MenuBar(QMenuBar):
         self.recent_profiles_menu.clear()
         
         if not profiles:
-            no_profiles_action = QAction("No recent profiles", self)
+            no_profiles_action = QAction("No recent profiles", self.recent_profiles_menu)
             no_profiles_action.setEnabled(False)
             self.recent_profiles_menu.addAction(no_profiles_action)
         else:
             for profile in profiles[:10]:  # Limit to 10 recent items
-                profile_action = QAction(profile, self)
-                profile_action.triggered.connect(lambda checked, p=profile: self.load_recent_profile(p))
+                # Owned by the menu so clear() deletes it on the next update
+                profile_action = QAction(profile, self.recent_profiles_menu)
+                profile_action.setData(profile)
                 self.recent_profiles_menu.addAction(profile_action)
     
+    def _on_recent_profile_triggered(self, action):
+        """Load the profile stored on a triggered recent-profiles entry."""
+        profile_name = action.data()
+        if profile_name:
+            self.load_recent_profile(profile_name)
+    
     
     def load_recent_profile(self, profile_name):
         """Load a recent profile."""
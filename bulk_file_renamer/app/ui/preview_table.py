@@ -0,0 +1,389 @@
+# Copyright (c) 2024 Dominic Ritzmann. All rights reserved.
+# 
+# This software is licensed under the Bulk File Renamer License.
+# See LICENSE file for full license terms.
+# 
+# You may use this software for personal and professional purposes, including
+# using it to organize and rename files as part of your business or selling
+# files that have been processed using this software.
+# 
+# However, you may NOT modify, alter, or create derivative works of this software,
+# or sell, distribute, or license this software itself without explicit written
+# permission from the copyright holder.
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QRect, QRectF, QItemSelectionModel, QTimer, QEvent, Signal
+from PySide6.QtGui import QFont, QFontMetrics, QPainter, QPixmap, QPalette
+from PySide6.QtWidgets import (
+    QTableView, QStyledItemDelegate, QStyleOptionViewItem, QStyle, QApplication
+)
+from app.ui.theme import qbrush, qcolor
+
+# Status badge (background, text) colors indexed by Status
+_BADGE_COLORS = (
+    ("#16A34A", "#FFFFFF"),  # green
+    ("#DC2626", "#FFFFFF"),  # red
+    ("#D97706", "#111827"),  # amber
+    ("#F59E0B", "#111827"),  # orange
+)
+_DEFAULT_BADGE_COLORS = ("#E5E7EB", "#111827")
+# The same colors resolved to paint objects once: (background brush, text color)
+_BADGE_STYLES = tuple((qbrush(bg), qcolor(fg)) for bg, fg in _BADGE_COLORS)
+_DEFAULT_BADGE_STYLE = (qbrush(_DEFAULT_BADGE_COLORS[0]), qcolor(_DEFAULT_BADGE_COLORS[1]))
+
+
+class PreviewModel(QAbstractTableModel):
+    """Read-only model over the preview columns kept by TopPanel.
+
+    Rows are only turned into display data when the view asks for them, so
+    the cost of a refresh no longer grows with the number of files. The view
+    is handed rows in batches (canFetchMore/fetchMore) as it scrolls down.
+    """
+
+    # Status code of a row (see app.utils.generate_preview.Status)
+    STATUS_ROLE = Qt.UserRole + 1
+    # Auto-resolved name offered for a conflicting row (new-name column only)
+    SUGGESTION_ROLE = Qt.UserRole + 2
+
+    # Same for every cell; flags() is left to the base class, whose C++ default
+    # (selectable, enabled, never has children) is already read-only
+    _ALIGNMENT = Qt.AlignVCenter | Qt.AlignLeft
+
+    # New-name color indexed by Status
+    _FOREGROUNDS = (qbrush("green"), qbrush("red"), qbrush("red"), qbrush("#FF8C00"))
+
+    # Rows exposed to the view per fetchMore()
+    _FETCH_BATCH = 1000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._headers = ("", "", "")
+        self._old_names = []
+        self._new_names = []
+        self._statuses = []
+        self._paths = []
+        self._suggestions = {}
+        # Number of rows exposed to the view so far
+        self._fetched = 0
+        # Crossed-out name for rows with a pending suggestion; only strikeOut is set,
+        # so the view's own font fills in everything else
+        self._strike_font = QFont()
+        self._strike_font.setStrikeOut(True)
+        # (label, new-name brush, tooltip) indexed by Status, resolved once per
+        # language/tooltip change so data() only indexes
+        self._status_roles = tuple(("", brush, None) for brush in self._FOREGROUNDS)
+
+    def set_rows(self, old_names, new_names, statuses, paths, suggestions=None):
+        """Replace the displayed rows; the lists (and suggestion dict) are shared, not copied."""
+        self.beginResetModel()
+        self._old_names = old_names
+        self._new_names = new_names
+        self._statuses = statuses
+        self._paths = paths
+        self._suggestions = suggestions if suggestions is not None else {}
+        self._fetched = min(len(old_names), self._FETCH_BATCH)
+        self.endResetModel()
+
+    def set_status_text(self, labels, tooltips=None):
+        """Set the translated status labels and tooltips (both indexed by Status)."""
+        self._status_roles = tuple(zip(labels, self._FOREGROUNDS, tooltips or (None,) * len(labels)))
+        if self._fetched:
+            self.dataChanged.emit(self.index(0, 1), self.index(self._fetched - 1, 2))
+
+    def refresh_row(self, row, first_col=0, last_col=2):
+        """Notify views that cells of a row were changed in place."""
+        self.dataChanged.emit(self.index(row, first_col), self.index(row, last_col))
+
+    def set_header_labels(self, labels):
+        self._headers = tuple(labels)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self._headers) - 1)
+
+    def header_labels(self):
+        return self._headers
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._fetched
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._fetched < len(self._old_names)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(len(self._old_names) - self._fetched, self._FETCH_BATCH)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._fetched, self._fetched + count - 1)
+        self._fetched += count
+        self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 3
+
+    def data(self, index, role=Qt.DisplayRole):
+        row = index.row()
+        col = index.column()
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return self._old_names[row]
+            if col == 1:
+                return self._new_names[row]
+            return self._status_roles[self._statuses[row]][0]
+        if role == Qt.ForegroundRole:
+            return self._status_roles[self._statuses[row]][1] if col == 1 else None
+        if role == Qt.ToolTipRole:
+            return self._status_roles[self._statuses[row]][2] if col == 1 else None
+        if role == Qt.TextAlignmentRole:
+            return self._ALIGNMENT
+        if role == Qt.FontRole:
+            return self._strike_font if col == 1 and row in self._suggestions else None
+        if role == Qt.UserRole:
+            # Original file path, used when removing rows from the selection
+            return self._paths[row] if col == 0 else None
+        if role == self.STATUS_ROLE:
+            return self._statuses[row]
+        if role == self.SUGGESTION_ROLE:
+            return self._suggestions.get(row) if col == 1 else None
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self._headers):
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+
+class BadgeDelegate(QStyledItemDelegate):
+    """Paints the status column as a small colored badge."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # (status, text, width, height, device pixel ratio) -> rendered badge
+        self._pixmaps = {}
+        # Badge font derived from the view font, and label -> text width + padding
+        self._font_key = None
+        self._font = None
+        self._fm = None
+        self._badge_height = 0
+        self._badge_widths = {}
+
+    def clear_cache(self):
+        """Drop rendered badges (e.g. after the status labels were retranslated)."""
+        self._pixmaps.clear()
+        self._badge_widths.clear()
+
+    def _badge_font(self, base_font):
+        """Return the (font, metrics) used for badges, rebuilt only when the view font changes."""
+        key = base_font.key()
+        if key != self._font_key:
+            font = QFont(base_font)
+            font.setWeight(QFont.Medium)
+            self._font_key, self._font, self._fm = key, font, QFontMetrics(font)
+            self._badge_height = self._fm.height() + 4
+            self._pixmaps.clear()
+            self._badge_widths.clear()
+        return self._font, self._fm
+
+    def _badge_pixmap(self, status, text, font, fm, width, height, dpr):
+        key = (status, text, width, height, dpr)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            bg, fg = _BADGE_STYLES[status] if status is not None else _DEFAULT_BADGE_STYLE
+            pixmap = QPixmap(round(width * dpr), round(height * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            p = QPainter(pixmap)
+            p.setRenderHint(QPainter.Antialiasing)
+            p.setFont(font)
+            p.setPen(Qt.NoPen)
+            p.setBrush(bg)
+            rect = QRect(0, 0, width, height)
+            p.drawRoundedRect(rect, 6, 6)
+            p.setPen(fg)
+            p.drawText(rect, Qt.AlignCenter, fm.elidedText(text, Qt.ElideRight, width - 12))
+            p.end()
+            self._pixmaps[key] = pixmap
+        return pixmap
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        text = opt.text
+        # Let the style draw the cell background/selection, then the badge on top
+        opt.text = ""
+        style = opt.widget.style() if opt.widget is not None else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+        if not text:
+            return
+
+        font, fm = self._badge_font(opt.font)
+        # Size badge to fit text (with padding) so it doesn't cut off (e.g., "No Change");
+        # text widths and the badge height only change with the font
+        text_w = self._badge_widths.get(text)
+        if text_w is None:
+            text_w = self._badge_widths[text] = fm.horizontalAdvance(text) + 18
+        rect = opt.rect
+        cell_w = rect.width() - 12
+        # Common case: the badge fits, so no clamping against the 80px minimum
+        width = text_w if text_w <= cell_w else min(max(80, cell_w), text_w)
+        height = min(self._badge_height, rect.height())
+        pixmap = self._badge_pixmap(
+            index.data(PreviewModel.STATUS_ROLE), text, font, fm, width, height,
+            painter.device().devicePixelRatioF(),
+        )
+        painter.drawPixmap(rect.left(), rect.top() + (rect.height() - height) // 2, pixmap)
+
+
+class SuggestionDelegate(QStyledItemDelegate):
+    """Paints accept/decline buttons next to a crossed-out name that has a suggestion.
+
+    The buttons are hit-tested in editorEvent, so no per-row widgets are needed.
+    """
+
+    accepted = Signal(int)
+    declined = Signal(int)
+
+    _BUTTON_WIDTH = 28
+    _BUTTON_SPACING = 6
+    _MARGIN = 8
+
+    def _button_rects(self, rect):
+        """(accept, decline) rects, right-aligned in the cell."""
+        height = min(rect.height() - 8, 24)
+        top = rect.top() + (rect.height() - height) // 2
+        decline = QRect(rect.right() - self._MARGIN - self._BUTTON_WIDTH + 1, top, self._BUTTON_WIDTH, height)
+        accept = decline.translated(-(self._BUTTON_WIDTH + self._BUTTON_SPACING), 0)
+        return accept, decline
+
+    def button_at(self, index, rect, pos):
+        """Return "accept", "decline" or None for a point inside the cell rect."""
+        if index.data(PreviewModel.SUGGESTION_ROLE) is None:
+            return None
+        accept, decline = self._button_rects(rect)
+        if accept.contains(pos):
+            return "accept"
+        if decline.contains(pos):
+            return "decline"
+        return None
+
+    def paint(self, painter, option, index):
+        if index.data(PreviewModel.SUGGESTION_ROLE) is None:
+            super().paint(painter, option, index)
+            return
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        style = opt.widget.style() if opt.widget is not None else QApplication.style()
+        accept, decline = self._button_rects(opt.rect)
+        # Cell background/selection across the full width, then the name clear of the buttons
+        text = opt.text
+        opt.text = ""
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+        opt.text = text
+        opt.state &= ~QStyle.State_HasFocus
+        opt.rect = QRect(opt.rect.left(), opt.rect.top(), accept.left() - opt.rect.left(), opt.rect.height())
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+
+        # Button colors from the view palette; opt's Text carries the red status foreground
+        palette = option.palette
+        text_color = palette.color(QPalette.Text)
+        border = palette.color(QPalette.Text)
+        border.setAlpha(60)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(palette.base())
+        for rect, glyph in ((accept, "✓"), (decline, "✕")):
+            painter.setPen(border)
+            painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 6, 6)
+            painter.setPen(text_color)
+            painter.drawText(rect, Qt.AlignCenter, glyph)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        etype = event.type()
+        if etype in (QEvent.MouseButtonPress, QEvent.MouseButtonDblClick, QEvent.MouseButtonRelease):
+            hit = self.button_at(index, option.rect, event.pos())
+            if hit is not None:
+                # Swallow the press so clicking a button doesn't toggle the row selection
+                if etype == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+                    (self.accepted if hit == "accept" else self.declined).emit(index.row())
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+class PreviewTable(QTableView):
+    """Preview view over a PreviewModel with toggle-style row selection."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAcceptDrops(False)  # Don't accept drops - let them bubble up to main window
+        self.setModel(PreviewModel(self))
+        self.suggestion_delegate = SuggestionDelegate(self)
+        self.setItemDelegateForColumn(1, self.suggestion_delegate)
+        self.setItemDelegateForColumn(2, BadgeDelegate(self))
+        self._anchor_row = None
+        # Empty-state overlay and its placement helper, provided by the owner
+        self._empty_overlay = None
+        self._reposition_overlay = lambda: None
+        # Resize bursts (window or splitter drags) reposition the empty overlay once they settle
+        self._overlay_timer = QTimer(self)
+        self._overlay_timer.setSingleShot(True)
+        self._overlay_timer.setInterval(30)
+        self._overlay_timer.timeout.connect(self._on_overlay_timer)
+
+    # Convenience accessors mirroring QTableWidget
+    def rowCount(self):
+        return self.model().rowCount()
+
+    def columnCount(self):
+        return self.model().columnCount()
+
+    def setHorizontalHeaderLabels(self, labels):
+        self.model().set_header_labels(labels)
+
+    def horizontalHeaderLabels(self):
+        return list(self.model().header_labels())
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # Reposition empty overlay if shown; a hidden one is placed again before it is shown
+        overlay = self._empty_overlay
+        if overlay is not None and overlay.isVisible():
+            self._overlay_timer.start()
+
+    def _on_overlay_timer(self):
+        self._reposition_overlay()
+
+    def mousePressEvent(self, event):
+        # Support range (Shift), additive toggle (Ctrl/Cmd), and simple toggle (no modifier)
+        try:
+            if event is not None and event.buttons() == Qt.LeftButton:
+                idx = self.indexAt(event.pos())
+                if idx.isValid() and self.suggestion_delegate.button_at(idx, self.visualRect(idx), event.pos()):
+                    # Let the view route the press to the delegate, which swallows it; the
+                    # matching release then triggers accept/decline (SuggestionDelegate.editorEvent)
+                    super().mousePressEvent(event)
+                    return
+                if idx.isValid():
+                    sel = self.selectionModel()
+                    mods = event.modifiers()
+                    if mods & Qt.ShiftModifier and self._anchor_row is not None:
+                        start = min(self._anchor_row, idx.row())
+                        end = max(self._anchor_row, idx.row())
+                        for r in range(start, end + 1):
+                            mi = self.model().index(r, 0)
+                            sel.select(mi, QItemSelectionModel.Select | QItemSelectionModel.Rows)
+                        return
+                    # On macOS use Command (Meta) as multi-select modifier
+                    elif (mods & Qt.ControlModifier) or (mods & Qt.MetaModifier):
+                        sel.select(idx, QItemSelectionModel.Toggle | QItemSelectionModel.Rows)
+                        # Keep anchor as first selected row for future shift selection
+                        if self._anchor_row is None:
+                            self._anchor_row = idx.row()
+                        return
+                    else:
+                        # Plain click toggles the row selection (easier multi-select without Ctrl)
+                        sel.select(idx, QItemSelectionModel.Toggle | QItemSelectionModel.Rows)
+                        if self._anchor_row is None:
+                            self._anchor_row = idx.row()
+                        return
+        except Exception:
+            pass
+        super().mousePressEvent(event)
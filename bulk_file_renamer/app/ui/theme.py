@@ -11,13 +11,28 @@
 # or sell, distribute, or license this software itself without explicit written
 # permission from the copyright holder.
 
+from functools import lru_cache
+
 from PySide6.QtWidgets import QWidget
+from PySide6.QtGui import QColor, QBrush
 from app.ui.custom_combobox import CustomComboBox
 from app.ui.custom_checkbox import CustomCheckBox
 from app.ui.custom_spinbox import CustomSpinBox
 from app.ui.plus_minus_spinbox import PlusMinusSpinBox
 
 
+@lru_cache(maxsize=None)
+def qcolor(hex_: str) -> QColor:
+    """Return a shared QColor for a color string (e.g. '#16A34A'); do not mutate it."""
+    return QColor(hex_)
+
+
+@lru_cache(maxsize=None)
+def qbrush(hex_: str) -> QBrush:
+    """Return a shared solid QBrush for a color string; do not mutate it."""
+    return QBrush(qcolor(hex_))
+
+
 def _apply_arrow_colors(widget: QWidget, color: str) -> None:
     """Apply arrow color to all CustomComboBox widgets in the widget tree."""
     # Apply to the widget itself if it's a CustomComboBox
@@ -88,17 +103,17 @@ QPushButton#SecondaryButton {
 QPushButton#SecondaryButton:hover { background: #F5F7FF; border-color: #8EB2F6; }
 
 /* Table */
-QTableWidget { background: #F8F9FA; border: 1px solid #D5D5D5; border-radius: 8px; gridline-color: #D5D5D5; color: #000000; }
-QTableWidget::item { padding: 8px; background: #F8F9FA; }
-QTableWidget::item:selected { background: #E3F2FD; color: #000000; }
-QTableWidget::item:selected:focus { background: #BBDEFB; color: #000000; }
-QTableWidget::item:alternate { background: #F8F9FA; }
+QTableView { background: #F8F9FA; border: 1px solid #D5D5D5; border-radius: 8px; gridline-color: #D5D5D5; color: #000000; }
+QTableView::item { padding: 8px; background: #F8F9FA; }
+QTableView::item:selected { background: #E3F2FD; color: #000000; }
+QTableView::item:selected:focus { background: #BBDEFB; color: #000000; }
+QTableView::item:alternate { background: #F8F9FA; }
 QHeaderView::section { background: #F8F9FA; color: #000000; padding: 8px; border: 0px; border-bottom: 1px solid #D5D5D5; font-weight: 600; }
 QTableCornerButton::section { background: #F8F9FA; border: 0px; border-bottom: 1px solid #D5D5D5; }
 /* Vertical header (row numbers) styling */
 QHeaderView::section:vertical { background: #F8F9FA; color: #6B7280; border: 0px; border-right: 1px solid #D5D5D5; font-weight: 500; }
 /* Vertical header background area */
-QTableWidget QHeaderView::section:vertical { background: #F8F9FA; }
+QTableView QHeaderView::section:vertical { background: #F8F9FA; }
 QHeaderView:vertical { background: #F8F9FA; }
 
 /* Group containers for settings/history - compact */
@@ -231,17 +246,17 @@ QPushButton#SecondaryButton {
 QPushButton#SecondaryButton:hover { background: #394047; }
 
 /* Table */
-QTableWidget { background: #2C2F33; border: 1px solid #2C2F33; border-radius: 8px; gridline-color: #2C2F33; color: #FFFFFF; }
-QTableWidget::item { padding: 8px; background: #2C2F33; }
-QTableWidget::item:selected { background: #1E3A8A; color: #FFFFFF; }
-QTableWidget::item:selected:focus { background: #1D4ED8; color: #FFFFFF; }
-QTableWidget::item:alternate { background: #2C2F33; }
+QTableView { background: #2C2F33; border: 1px solid #2C2F33; border-radius: 8px; gridline-color: #2C2F33; color: #FFFFFF; }
+QTableView::item { padding: 8px; background: #2C2F33; }
+QTableView::item:selected { background: #1E3A8A; color: #FFFFFF; }
+QTableView::item:selected:focus { background: #1D4ED8; color: #FFFFFF; }
+QTableView::item:alternate { background: #2C2F33; }
 QHeaderView::section { background: #2C2F33; color: #FFFFFF; padding: 8px; border: 0px; border-bottom: 1px solid #2C2F33; font-weight: 600; }
 QTableCornerButton::section { background: #2C2F33; border: 0px; border-bottom: 1px solid #2C2F33; }
 /* Vertical header (row numbers) styling */
 QHeaderView::section:vertical { background: #2C2F33; color: #9CA3AF; border: 0px; border-right: 1px solid #2C2F33; font-weight: 500; }
 /* Vertical header background area */
-QTableWidget QHeaderView::section:vertical { background: #2C2F33; }
+QTableView QHeaderView::section:vertical { background: #2C2F33; }
 QHeaderView:vertical { background: #2C2F33; }
 
 /* Group containers - compact */
@@ -11,25 +11,89 @@
 # or sell, distribute, or license this software itself without explicit written
 # permission from the copyright holder.
 
+
+import csv
+import json
+from datetime import datetime
+
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, QLabel, QTableWidget,
-    QTableWidgetItem, QHeaderView, QComboBox, QCheckBox, QSizePolicy, QGroupBox,
-    QScrollArea, QSplitter
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, QLabel, QAbstractItemView,
+    QHeaderView, QComboBox, QCheckBox, QSizePolicy, QGroupBox, QScrollArea, QSplitter,
+    QDialog, QFileDialog, QMessageBox
 )
 from app.ui.custom_scrollbar import CustomScrollBar
+from app.ui.preview_table import PreviewTable
 from .custom_combobox import CustomComboBox
 from .custom_checkbox import CustomCheckBox
 from .custom_search_field import CustomSearchField
-from PySide6.QtGui import QColor, QBrush
-from PySide6.QtCore import Qt, Signal
-from app.ui.history_panel import HistoryPanel
-from app.ui.file_count_row import FileCountRow
-from .date_input import DateInput
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QSignalBlocker, QMetaObject
 from app.utils.translation_manager import get_translation_manager
+from app.utils.generate_preview import Status, STATUS_TEXT, STATUS_FROM_TEXT
 # Theme is applied at the main window level; avoid forcing a specific theme here
 
+# Shared size policies (copied by value in setSizePolicy, so one instance per combination is enough)
+_SP_EXPANDING_FIXED = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+_SP_EXPANDING_PREFERRED = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+_SP_PREFERRED_MAXIMUM = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Maximum)
+_SP_PREFERRED = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+_SP_EXPANDING = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+# Start number field: red border until a valid number is entered (see _update_start_number_styling)
+_START_NUMBER_QSS = (
+    'QLineEdit#startNumberField { border: 2px solid #ff6b6b; }'
+    'QLineEdit#startNumberField[valid="true"] { border: 1px solid #D5D5D5; }'
+)
+
+# Equivalent status names across languages; a search matches a status when it
+# is part of any of the names in its group
+_STATUS_SYNONYMS = (
+    ("renamed", "umbenannt"),
+    ("unchanged", "unverändert"),
+    ("error", "fehler"),
+    ("duplicate", "duplikat"),
+    ("invalid", "ungültig"),
+    ("ready", "bereit"),
+    ("no change", "keine änderung"),
+    ("conflict", "konflikt"),
+    ("extension locked", "erweiterung gesperrt"),
+)
+# Lowercased status -> every name it may be searched by
+_STATUS_INDEX = {name: group for group in _STATUS_SYNONYMS for name in group}
+
+
 class TopPanel(QWidget):
     remove_selected = Signal(list)
+
+    # Signals that schedule a preview: (widget attribute, signal, slot)
+    _PREVIEW_WIRES = (
+        ("prefix_input", "textChanged", "_debounced_preview"),
+        ("suffix_input", "textChanged", "_debounced_preview"),
+        ("base_input", "textChanged", "_debounced_preview"),
+        ("start_input", "textChanged", "_debounced_preview"),
+        ("extension_lock_checkbox", "stateChanged", "_kick_preview"),
+        ("search_input", "textChanged", "_debounced_preview"),
+        ("remove_special_chars_check", "stateChanged", "_kick_preview"),
+        ("replace_spaces_check", "stateChanged", "_kick_preview"),
+        ("convert_case_check", "stateChanged", "_kick_preview"),
+        ("remove_accents_check", "stateChanged", "_kick_preview"),
+        ("case_type_combo", "currentIndexChanged", "_on_case_type_changed"),
+        ("ext_filter_input", "textChanged", "_debounced_preview"),
+        ("size_value", "textChanged", "_debounced_preview"),
+        ("date_value", "textChanged", "_debounced_preview"),
+        ("size_operator", "currentIndexChanged", "_kick_preview"),
+        ("size_unit", "currentIndexChanged", "_kick_preview"),
+        ("date_operator", "currentIndexChanged", "_kick_preview"),
+        ("status_filter", "currentIndexChanged", "_kick_preview"),
+    )
+
+    # Preview debounce intervals (ms): discrete toggles vs. keystrokes in text fields
+    _INPUT_DEBOUNCE_MS = 30
+    _TEXT_DEBOUNCE_MS = 120
+    # Next direction when the sorted column's header is clicked again (None: unsorted)
+    _NEXT_SORT_DIRECTION = {True: False, False: None}
+    # JSON exports up to this many rows are indented for readability
+    _JSON_PRETTY_MAX_ROWS = 5000
+
     def __init__(self, browse_folder_cb, select_files_cb, clear_all_cb, preview_callback,
                  save_profile_cb=None, load_profile_cb=None, delete_profile_cb=None, refresh_profiles_cb=None,
                  rename_cb=None, undo_cb=None, undo_selected_cb=None, validate_cb=None):
@@ -47,6 +111,16 @@ class TopPanel(QWidget):
         # Get translation manager
         self.tr_manager = get_translation_manager()
 
+        # Input changes schedule a preview through this timer so bursts coalesce into one refresh
+        # (typing waits longer than discrete toggles, see _kick_preview/_debounced_preview)
+        self._preview_debounce = QTimer(self)
+        self._preview_debounce.setSingleShot(True)
+        self._preview_debounce.setInterval(self._INPUT_DEBOUNCE_MS)
+        self._preview_debounce.timeout.connect(self.preview_callback)
+        # (signal, slot) pairs that trigger a preview; see _bind
+        self._preview_binds = []
+        self._preview_wired = True
+
         # Root two-column layout
         root = QHBoxLayout()
         root.setContentsMargins(12, 12, 12, 12)
@@ -58,13 +132,19 @@ class TopPanel(QWidget):
         right_panel = QVBoxLayout()
         right_panel.setSpacing(8)
 
+        # Resolve the section titles, placeholders and tooltips used below in one pass
+        texts = self.tr_manager.tr_many([
+            "top_panel.naming.title", "top_panel.auto_clean.title", "top_panel.files.title",
+            "top_panel.filters.title", "top_panel.profiles.title",
+            "top_panel.naming.prefix", "top_panel.naming.suffix",
+            "top_panel.naming.base_name", "top_panel.naming.start_number",
+            "ui.tooltip_prefix", "ui.tooltip_suffix", "ui.tooltip_base_name", "ui.tooltip_start_number",
+        ])
+
         # Helper for localized titles with sensible fallbacks
         def _t_title(key: str, fallback: str) -> str:
-            try:
-                val = self.tr_manager.tr(key)
-                return val if val and val != key else fallback
-            except Exception:
-                return fallback
+            val = texts.get(key)
+            return val if val and val != key else fallback
 
         # Theme is applied by parent via app.ui.theme.apply_theme
 
@@ -77,22 +157,24 @@ class TopPanel(QWidget):
             return text.replace(":", "") if isinstance(text, str) else text
 
         self.prefix_input = QLineEdit()
-        self.prefix_input.setPlaceholderText(_strip_colon(self.tr_manager.tr("top_panel.naming.prefix")))
-        self.prefix_input.setToolTip(self.tr_manager.tr("ui.tooltip_prefix"))
+        self.prefix_input.setPlaceholderText(_strip_colon(texts["top_panel.naming.prefix"]))
+        self.prefix_input.setToolTip(texts["ui.tooltip_prefix"])
         self.suffix_input = QLineEdit()
-        self.suffix_input.setPlaceholderText(_strip_colon(self.tr_manager.tr("top_panel.naming.suffix")))
-        self.suffix_input.setToolTip(self.tr_manager.tr("ui.tooltip_suffix"))
+        self.suffix_input.setPlaceholderText(_strip_colon(texts["top_panel.naming.suffix"]))
+        self.suffix_input.setToolTip(texts["ui.tooltip_suffix"])
         self.base_input = QLineEdit()
-        self.base_input.setPlaceholderText(_strip_colon(self.tr_manager.tr("top_panel.naming.base_name")))
-        self.base_input.setToolTip(self.tr_manager.tr("ui.tooltip_base_name"))
+        self.base_input.setPlaceholderText(_strip_colon(texts["top_panel.naming.base_name"]))
+        self.base_input.setToolTip(texts["ui.tooltip_base_name"])
         self.start_input = QLineEdit()
-        self.start_input.setPlaceholderText(_strip_colon(self.tr_manager.tr("top_panel.naming.start_number")))
+        self.start_input.setPlaceholderText(_strip_colon(texts["top_panel.naming.start_number"]))
         # Start number is required when renaming files
-        self.start_input.setToolTip(self.tr_manager.tr("ui.tooltip_start_number"))
+        self.start_input.setToolTip(texts["ui.tooltip_start_number"])
         # Set a custom object name for specific styling
         self.start_input.setObjectName("startNumberField")
-        # Add visual indicator that this field is required
-        self.start_input.setStyleSheet("QLineEdit#startNumberField { border: 2px solid #ff6b6b !important; }")  # Red border to indicate required
+        # Parsed once here; validity only toggles the "valid" property the sheet matches on
+        self.start_input.setStyleSheet(_START_NUMBER_QSS)
+        self.start_input.setProperty("valid", False)
+        self._start_number_valid = False
         
         # Track focus state for better focus maintenance
         self._start_input_has_focus = False
@@ -101,24 +183,19 @@ class TopPanel(QWidget):
         naming_row1.addWidget(self.suffix_input)
         
         # Right side: Extension Lock
-        self.extension_lock_checkbox = CustomCheckBox("🔒 " + self.tr_manager.tr("top_panel.naming.extension_lock"))
+        self.extension_lock_checkbox = CustomCheckBox()
         self.extension_lock_checkbox.setChecked(True)
         self.extension_lock_checkbox.setToolTip(self.tr_manager.tr("ui.extension_lock_tooltip"))
         
-        # Add a callback to update the checkbox text based on state
-        def update_checkbox_text():
-            if self.extension_lock_checkbox.isChecked():
-                self.extension_lock_checkbox.setText("🔒 " + self.tr_manager.tr("top_panel.naming.extension_lock_active"))
-            else:
-                self.extension_lock_checkbox.setText("🔓 " + self.tr_manager.tr("top_panel.naming.extension_lock_disabled"))
-        
-        self.extension_lock_checkbox.stateChanged.connect(update_checkbox_text)
-        update_checkbox_text()  # Set initial text
+        # Update the checkbox text based on state (texts are rebuilt on language change)
+        self._rebuild_lock_texts()
+        self.extension_lock_checkbox.stateChanged.connect(self._update_lock_text)
+        self._update_lock_text()  # Set initial text
         
         # (Extension lock will be placed on its own row below)
         # --- Naming group ---
         self.naming_group = QGroupBox(_t_title("top_panel.naming.title", "Naming"))
-        self.naming_group.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Maximum)
+        self.naming_group.setSizePolicy(_SP_PREFERRED_MAXIMUM)
         naming_group_layout = QVBoxLayout()
         naming_group_layout.setSpacing(8)
         # Row1: Prefix + Suffix
@@ -144,66 +221,8 @@ class TopPanel(QWidget):
         # Auto-clean controls (nested group inside Naming)
         # Title becomes the group header to visually look like a sub-section
         auto_clean_title = _t_title("top_panel.auto_clean.title", "Auto-clean")
-        
-        # Auto-clean checkboxes
-        self.remove_special_chars_check = CustomCheckBox(self.tr_manager.tr("top_panel.auto_clean.remove_special_chars"))
-        self.replace_spaces_check = CustomCheckBox(self.tr_manager.tr("top_panel.auto_clean.replace_spaces"))
-        self.convert_case_check = CustomCheckBox(self.tr_manager.tr("top_panel.auto_clean.convert_case"))
-        self.remove_accents_check = CustomCheckBox(self.tr_manager.tr("top_panel.auto_clean.remove_accents"))
-        
-        # Case conversion dropdown
-        self.case_type_combo = CustomComboBox()
-        self.case_type_combo.addItems([
-            self.tr_manager.tr("top_panel.auto_clean.case_types.lowercase"),
-            self.tr_manager.tr("top_panel.auto_clean.case_types.titlecase"),
-            self.tr_manager.tr("top_panel.auto_clean.case_types.uppercase")
-        ])
-        # Default to Titlecase
-        try:
-            _title_txt = self.tr_manager.tr("top_panel.auto_clean.case_types.titlecase")
-            _idx = self.case_type_combo.findText(_title_txt)
-            if _idx >= 0:
-                self.case_type_combo.setCurrentIndex(_idx)
-        except Exception:
-            pass
-        # Set size policy to prevent cutoff
-        self.case_type_combo.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        # Keep dropdown enabled always; selecting a value can auto-enable the checkbox
-        
-        # Connect case checkbox (no longer controls enabled state of dropdown)
-        self.convert_case_check.stateChanged.connect(self.preview_callback)
-        
-        # Row1 inside auto-clean: Special Chars
-        ac_row1 = QHBoxLayout()
-        ac_row1.setSpacing(8)
-        ac_row1.addWidget(self.remove_special_chars_check)
-
-        # Row2: Replace Spaces
-        ac_row2 = QHBoxLayout()
-        ac_row2.setSpacing(8)
-        ac_row2.addWidget(self.replace_spaces_check)
-
-        # Row3: Remove Accents
-        ac_row3 = QHBoxLayout()
-        ac_row3.setSpacing(8)
-        ac_row3.addWidget(self.remove_accents_check)
-
-        # Row4: Convert Case + case type dropdown
-        ac_row4 = QHBoxLayout()
-        ac_row4.setSpacing(8)
-        ac_row4.addWidget(self.convert_case_check)
-        ac_row4.addWidget(self.case_type_combo)
-        ac_row4.addStretch()
-
-        # Compose nested auto-clean group and add to Naming section
         self.auto_group = QGroupBox(auto_clean_title)
-        auto_group_layout = QVBoxLayout()
-        auto_group_layout.setSpacing(8)
-        auto_group_layout.addLayout(ac_row1)
-        auto_group_layout.addLayout(ac_row2)
-        auto_group_layout.addLayout(ac_row3)
-        auto_group_layout.addLayout(ac_row4)
-        self.auto_group.setLayout(auto_group_layout)
+        self._build_auto_group(self.auto_group)
         naming_group_layout.addWidget(self.auto_group)
 
         # Files section (buttons)
@@ -222,8 +241,8 @@ class TopPanel(QWidget):
             pass
         # Make them share the row equally
         try:
-            self.btn_browse_folder.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-            self.btn_browse_files.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+            self.btn_browse_folder.setSizePolicy(_SP_EXPANDING_PREFERRED)
+            self.btn_browse_files.setSizePolicy(_SP_EXPANDING_PREFERRED)
         except Exception:
             pass
         self.btn_browse_folder.clicked.connect(lambda: self.browse_folder_cb(None))
@@ -233,156 +252,22 @@ class TopPanel(QWidget):
         files_row.addWidget(self.btn_browse_files, 1)
         # --- Files group ---
         self.files_group = QGroupBox(_t_title("top_panel.files.title", "Files"))
-        self.files_group.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Maximum)
+        self.files_group.setSizePolicy(_SP_PREFERRED_MAXIMUM)
         files_group_layout = QVBoxLayout()
         files_group_layout.setSpacing(8)
         # Place both buttons on the same row, each occupying half width
         files_group_layout.addLayout(files_row)
         self.files_group.setLayout(files_group_layout)
 
-        # Profile Management
-        profile_layout = QHBoxLayout()
-        profile_layout.setSpacing(8)
-        self.profile_combo = CustomComboBox()
-        self.profile_combo.setPlaceholderText(self.tr_manager.tr("top_panel.profiles.select_profile_placeholder"))
-        # Set size policy to prevent cutoff
-        self.profile_combo.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self.btn_save_profile = QPushButton(self.tr_manager.tr("top_panel.profiles.save"))
-        self.btn_save_profile.setObjectName("SecondaryButton")
-        self.btn_load_profile = QPushButton(self.tr_manager.tr("top_panel.profiles.load"))
-        self.btn_load_profile.setObjectName("SecondaryButton")
-        self.btn_delete_profile = QPushButton(self.tr_manager.tr("top_panel.profiles.delete"))
-        self.btn_delete_profile.setObjectName("SecondaryButton")
-        
-        profile_label = QLabel(self.tr_manager.tr("top_panel.profiles.profile"))
-        profile_layout.addWidget(profile_label)
-        profile_layout.addWidget(self.profile_combo, 1)
-        profile_layout.addWidget(self.btn_save_profile)
-        profile_layout.addWidget(self.btn_load_profile)
-        profile_layout.addWidget(self.btn_delete_profile)
-        
-        # Connect profile buttons
-        self.btn_save_profile.clicked.connect(self._on_save_profile)
-        self.btn_load_profile.clicked.connect(self._on_load_profile)
-        self.btn_delete_profile.clicked.connect(self._on_delete_profile)
-        
         # --- Profiles group ---
         self.profiles_group = QGroupBox(_t_title("top_panel.profiles.title", "Profiles"))
-        self.profiles_group.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Maximum)
-        profiles_group_layout = QVBoxLayout()
-        profiles_group_layout.setSpacing(8)
-        # Row1: profile combo full width
-        profile_row1 = QHBoxLayout()
-        profile_row1.setSpacing(8)
-        profile_row1.addWidget(self.profile_combo, 1)
-        profiles_group_layout.addLayout(profile_row1)
-        # Row2: Save + Load
-        profile_row2 = QHBoxLayout()
-        profile_row2.setSpacing(8)
-        profile_row2.addWidget(self.btn_save_profile)
-        profile_row2.addWidget(self.btn_load_profile)
-        profiles_group_layout.addLayout(profile_row2)
-        # Row3: Delete full width
-        profiles_group_layout.addWidget(self.btn_delete_profile)
-        self.profiles_group.setLayout(profiles_group_layout)
+        self.profiles_group.setSizePolicy(_SP_PREFERRED_MAXIMUM)
+        self._build_profiles_group(self.profiles_group)
 
-        # Row 3: Filters - organized in logical groups
-        filter_row = QHBoxLayout()
-        filter_row.setSpacing(8)
-        
-        # Extension filter
-        self.ext_filter_input = QLineEdit()
-        self.ext_filter_input.setPlaceholderText(self.tr_manager.tr("top_panel.filters.extension_placeholder"))
-        filter_row.addWidget(QLabel(self.tr_manager.tr("top_panel.filters.extension_filter")))
-        filter_row.addWidget(self.ext_filter_input)
-        
-        # Size filter group
-        self.size_operator = CustomComboBox()
-        # Use human-readable operators in UI
-        self.size_operator.addItems([
-            self.tr_manager.tr("ui.size_operators.greater_than"),
-            self.tr_manager.tr("ui.size_operators.less_than"),
-            self.tr_manager.tr("ui.size_operators.equal")
-        ])
-        # Set size policy to prevent cutoff
-        self.size_operator.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self.size_value = QLineEdit()
-        self.size_value.setPlaceholderText(self.tr_manager.tr("top_panel.filters.size_placeholder"))
-        # Allow the size value field to expand on smaller displays
-        self.size_value.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self.size_unit = CustomComboBox()
-        # Use standard abbreviations to match tests
-        self.size_unit.addItems(["B", "KB", "MB", "GB"])
-        # Set minimum width to prevent text truncation
-        self.size_unit.setMinimumWidth(60)
-        # Set size policy to prevent cutoff
-        self.size_unit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        filter_row.addWidget(QLabel(self.tr_manager.tr("top_panel.filters.size_filter")))
-        filter_row.addWidget(self.size_operator)
-        filter_row.addWidget(self.size_value)
-        
-        # Date filter group
-        self.date_operator = CustomComboBox()
-        self.date_operator.addItems([
-            self.tr_manager.tr("top_panel.filters.date_operators.before"),
-            self.tr_manager.tr("top_panel.filters.date_operators.after")
-        ])
-        # Set size policy to prevent cutoff
-        self.date_operator.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self.date_value = DateInput()
-        # Connect date validation signal to show notifications
-        self.date_value.date_validation_changed.connect(self._on_date_validation_changed)
-        filter_row.addWidget(QLabel(self.tr_manager.tr("top_panel.filters.date_filter")))
-        filter_row.addWidget(self.date_operator)
-        filter_row.addWidget(self.date_value)
-        
-        # Status filter
-        self.status_filter = CustomComboBox()
-        # Use status values consistent with preview statuses and tests
-        self.status_filter.addItems([
-            self.tr_manager.tr("top_panel.filters.status_options.all"),
-            self.tr_manager.tr("ui.status_options.ready"),
-            self.tr_manager.tr("ui.status_options.conflict"),
-            self.tr_manager.tr("ui.status_options.no_change"),
-            self.tr_manager.tr("ui.status_options.extension_locked")
-        ])
-        # Set size policy to prevent cutoff
-        self.status_filter.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self.status_filter.setCurrentIndex(0)  # Set to "All" by default
-        filter_row.addWidget(QLabel(self.tr_manager.tr("top_panel.filters.status_filter")))
-        filter_row.addWidget(self.status_filter)
-        
         # --- Filters group ---
         self.filters_group = QGroupBox(_t_title("top_panel.filters.title", "Filters"))
-        self.filters_group.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Maximum)
-        filters_group_layout = QVBoxLayout()
-        filters_group_layout.setSpacing(8)
-        # Row1: Extension filter full width
-        ext_row = QHBoxLayout()
-        ext_row.setSpacing(8)
-        ext_row.addWidget(self.ext_filter_input, 1)
-        filters_group_layout.addLayout(ext_row)
-        # Row2: Size operator + value (unit moved to status row for space)
-        size_row = QHBoxLayout()
-        size_row.setSpacing(8)
-        size_row.addWidget(self.size_operator)
-        size_row.addWidget(self.size_value, 1)
-        # Row3: Date operator + value
-        date_row = QHBoxLayout()
-        date_row.setSpacing(8)
-        date_row.addWidget(self.date_operator)
-        date_row.addWidget(self.date_value, 1)
-        # Add Date row before Size row
-        filters_group_layout.addLayout(date_row)
-        # Now add Size row
-        filters_group_layout.addLayout(size_row)
-        # Row4: Status filter with unit dropdown to the right
-        status_row = QHBoxLayout()
-        status_row.setSpacing(8)
-        status_row.addWidget(self.status_filter, 1)
-        status_row.addWidget(self.size_unit)
-        filters_group_layout.addLayout(status_row)
-        self.filters_group.setLayout(filters_group_layout)
+        self.filters_group.setSizePolicy(_SP_PREFERRED_MAXIMUM)
+        # (its controls are built below, once the status labels exist)
 
         # Add groups to sidebar
         self.naming_group.setLayout(naming_group_layout)
@@ -406,92 +291,22 @@ class TopPanel(QWidget):
         self.btn_clear = QPushButton(self.tr_manager.tr("main.clear_all"))
         self.btn_clear.setObjectName("SecondaryButton")
         # Remove fixed width to allow responsive sizing
-        self.btn_clear.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        self.btn_clear.setSizePolicy(_SP_PREFERRED)
         self.btn_clear.clicked.connect(self.clear_all_cb)
         search_row.addWidget(self.btn_clear)
         
         self.export_btn = QPushButton(self.tr_manager.tr("top_panel.preview.export_preview"))
         self.export_btn.setObjectName("PrimaryButton")
         # Remove fixed width to allow responsive sizing
-        self.export_btn.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        self.export_btn.setSizePolicy(_SP_PREFERRED)
         search_row.addWidget(self.export_btn)
         
         right_panel.addLayout(search_row)
 
-        # Preview Table
-        # QTableWidget subclass to expose horizontalHeaderLabels() for tests
-        class PreviewTable(QTableWidget):
-            def __init__(self, *args, **kwargs):
-                super().__init__(*args, **kwargs)
-                self.tr_manager = get_translation_manager()
-                self.setAcceptDrops(False)  # Don't accept drops - let them bubble up to main window
-            
-            def horizontalHeaderLabels(self):
-                return [self.horizontalHeaderItem(i).text() if self.horizontalHeaderItem(i) else "" for i in range(self.columnCount())]
-            
-            def resizeEvent(self, event):
-                super().resizeEvent(event)
-                # Reposition empty overlay if present
-                try:
-                    if hasattr(self, "_reposition_overlay") and callable(self._reposition_overlay):
-                        self._reposition_overlay()
-                except Exception:
-                    pass
-
-            def mousePressEvent(self, event):
-                # Support range (Shift), additive toggle (Ctrl/Cmd), and simple toggle (no modifier)
-                try:
-                    if event is not None and event.buttons() == Qt.LeftButton:
-                        idx = self.indexAt(event.pos())
-                        if idx.isValid():
-                            from PySide6.QtCore import QItemSelectionModel
-                            sel = self.selectionModel()
-                            mods = event.modifiers()
-                            if mods & Qt.ShiftModifier and hasattr(self, "_anchor_row") and self._anchor_row is not None:
-                                start = min(self._anchor_row, idx.row())
-                                end = max(self._anchor_row, idx.row())
-                                for r in range(start, end + 1):
-                                    mi = self.model().index(r, 0)
-                                    sel.select(mi, QItemSelectionModel.Select | QItemSelectionModel.Rows)
-                                return
-                            # On macOS use Command (Meta) as multi-select modifier
-                            elif (mods & Qt.ControlModifier) or (mods & Qt.MetaModifier):
-                                sel.select(idx, QItemSelectionModel.Toggle | QItemSelectionModel.Rows)
-                                # Keep anchor as first selected row for future shift selection
-                                if not hasattr(self, "_anchor_row") or self._anchor_row is None:
-                                    self._anchor_row = idx.row()
-                                return
-                            else:
-                                # Plain click toggles the row selection (easier multi-select without Ctrl)
-                                sel.select(idx, QItemSelectionModel.Toggle | QItemSelectionModel.Rows)
-                                if not hasattr(self, "_anchor_row") or self._anchor_row is None:
-                                    self._anchor_row = idx.row()
-                                return
-                except Exception:
-                    pass
-                super().mousePressEvent(event)
-            
-            def show_loading(self, show: bool):
-                if not hasattr(self, "_loading_overlay"):
-                    from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
-                    self._loading_overlay = QWidget(self.viewport())
-                    self._loading_overlay.setAttribute(Qt.WA_TransparentForMouseEvents, True)
-                    lay = QVBoxLayout(self._loading_overlay)
-                    lay.setContentsMargins(0, 0, 0, 0)
-                    lay.setAlignment(Qt.AlignCenter)
-                    lbl = QLabel(self.tr_manager.tr("ui.loading"))
-                    lbl.setStyleSheet("QLabel { color: #6B7280; font-size: 13px; }")
-                    lay.addWidget(lbl)
-                    self._loading_overlay.hide()
-                r = self.viewport().rect()
-                height = 56
-                self._loading_overlay.setGeometry(r.x(), r.y() + r.height() - height, r.width(), height)
-                self._loading_overlay.setStyleSheet("background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 rgba(0,0,0,0.0), stop:1 rgba(0,0,0,0.04)); border: none;")
-                self._loading_overlay.setVisible(show)
-
-        self.table = PreviewTable(0, 3)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.MultiSelection)
+        # Preview Table (model/view: rows are only materialized for painting)
+        self.table = PreviewTable()
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.MultiSelection)
         self.table.setHorizontalHeaderLabels([
             self.tr_manager.tr("top_panel.preview.old_name"),
             self.tr_manager.tr("top_panel.preview.new_name"),
@@ -520,8 +335,10 @@ class TopPanel(QWidget):
             self.table.setColumnWidth(2, 160)
         except Exception:
             pass
-        # Increase default row height so inline buttons fit
+        # Increase default row height so inline buttons fit; all rows share it,
+        # so the view can place rows without measuring each one
         try:
+            self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
             self.table.verticalHeader().setDefaultSectionSize(34)
         except Exception:
             pass
@@ -529,9 +346,8 @@ class TopPanel(QWidget):
         self.table.setShowGrid(False)
         self.table.setWordWrap(False)
         # Make the table expand to fill available space within TopPanel
-        self.table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.table.setSizePolicy(_SP_EXPANDING)
         # Smooth scrolling behavior
-        from PySide6.QtWidgets import QAbstractItemView
         self.table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
         self.table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
         # Apply custom scrollbars to the preview table
@@ -542,15 +358,37 @@ class TopPanel(QWidget):
         self.sort_column = -1  # -1 means no sorting
         self.sort_ascending = True
         
-        # Lazy loading state
-        self._full_preview_data = []
-        self._rendered_rows = 0
-        # Fixed batch size for lazy loading - no longer depends on max files setting
-        self._batch_size = 100
-        
-        # Load more on scroll near bottom
-        self.table.verticalScrollBar().valueChanged.connect(self._maybe_load_more_rows)
-        self.table.itemSelectionChanged.connect(self._on_table_selection_changed)
+        # Preview rows are stored column-wise and shared with the table model
+        self._old_names = []
+        self._new_names = []
+        self._statuses = []  # Status codes
+        self._paths = []
+        self._suggestions = {}  # row -> auto-resolved name for "Conflict|<name>" rows
+        # get_current_preview_data() result; None once the columns or status labels change
+        self._preview_data = None
+        # Translated status labels/tooltips indexed by Status; rebuilt on language change
+        self._tooltips_enabled = True
+        self._status_labels = ()
+        self._status_tooltips = ()
+        self._rebuild_status_labels()
+        # The status filter lists the translated status labels
+        self._build_filters_group(self.filters_group)
+        # Rows currently displayed, as passed to the model (see update_preview)
+        self._shown_preview = None
+        # Last sorted preview (see _sorted_preview)
+        self._sort_cache_key = None
+        self._sort_cache_source = None
+        self._sort_cache_value = []
+        # Lowercased columns of the last searched preview (see _lowered_columns)
+        self._lower_source = None
+        self._lower_cache = []
+        # Set when the preview changed while the panel was hidden; flushed by showEvent
+        self._view_stale = False
+        
+        self.table.selectionModel().selectionChanged.connect(self._on_table_selection_changed)
+        # Accept/decline for auto-resolved conflicts are painted by the table's delegate
+        self.table.suggestion_delegate.accepted.connect(self._accept_suggestion)
+        self.table.suggestion_delegate.declined.connect(self._decline_suggestion)
         
         # Make headers clickable
         self.table.horizontalHeader().sectionClicked.connect(self._on_header_clicked)
@@ -591,11 +429,8 @@ class TopPanel(QWidget):
         def _reposition_overlay():
             vp = self.table.viewport().rect()
             # Compute a content-aware minimum height
-            try:
-                m = self._empty_layout.contentsMargins()
-                content_h = self._empty_icon.sizeHint().height() + self._empty_text.sizeHint().height() + self._empty_layout.spacing() + m.top() + m.bottom()
-            except Exception:
-                content_h = 120
+            m = self._empty_layout.contentsMargins()
+            content_h = self._empty_icon.sizeHint().height() + self._empty_text.sizeHint().height() + self._empty_layout.spacing() + m.top() + m.bottom()
             width = max(min(int(vp.width() * 0.8), 600), 260)
             height = max(min(int(vp.height() * 0.6), 220), content_h)
             x = vp.x() + max((vp.width() - width) // 2, 0)
@@ -605,6 +440,7 @@ class TopPanel(QWidget):
         # initial text set after helper definition below
 
         # Create file count and action buttons (will be added between table and history)
+        from app.ui.file_count_row import FileCountRow
         self.file_count = FileCountRow()
 
         btn_row = QHBoxLayout()
@@ -640,12 +476,15 @@ class TopPanel(QWidget):
         btn_row.addWidget(self.remove_selected_btn)
         btn_row.addStretch()
 
-        # History panel below actions
-        self.history_panel = HistoryPanel()
+        # History panel below actions; built on first use (see _ensure_history_panel),
+        # until then an empty placeholder holds its place in the layout
+        self._history_panel = None
+        self._history_placeholder = QWidget()
+        self._history_visible = True
+        self._history_theme = None
         
         # Create a container for file count, buttons, and history
-        from PySide6.QtWidgets import QWidget as _QWidget
-        bottom_container = _QWidget()
+        bottom_container = QWidget()
         bottom_container.setObjectName("HistoryArea")
         bottom_layout = QVBoxLayout(bottom_container)
         bottom_layout.setContentsMargins(0, 8, 0, 0)  # Small top margin for spacing
@@ -654,7 +493,8 @@ class TopPanel(QWidget):
         # Add file count, buttons, and history to the bottom container
         bottom_layout.addWidget(self.file_count)
         bottom_layout.addLayout(btn_row)
-        bottom_layout.addWidget(self.history_panel, 1)  # History gets stretch factor
+        bottom_layout.addWidget(self._history_placeholder, 1)  # History gets stretch factor
+        self._bottom_layout = bottom_layout
         
         # Create vertical splitter for table and bottom container
         vertical_splitter = QSplitter(Qt.Vertical)
@@ -675,17 +515,16 @@ class TopPanel(QWidget):
         right_panel.addWidget(vertical_splitter, 1)
 
         # Assemble two-column layout with resizable sidebar
-        from PySide6.QtWidgets import QWidget as _QW
-        left_container = _QW()
+        left_container = QWidget()
         left_container.setLayout(left_sidebar)
         left_container.setMinimumWidth(400)  # Increased minimum width to prevent text truncation
         # Allow sidebar to expand up to half the screen width (no maximum width constraint)
-        left_container.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        left_container.setSizePolicy(_SP_PREFERRED)
 
-        right_container = _QW()
+        right_container = QWidget()
         right_container.setObjectName("PreviewArea")
         right_container.setLayout(right_panel)
-        right_container.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        right_container.setSizePolicy(_SP_EXPANDING)
 
         # Use a splitter for responsive horizontal resizing
         splitter = QSplitter(Qt.Horizontal)
@@ -711,11 +550,7 @@ class TopPanel(QWidget):
         self.setLayout(root)
 
         # Connect preview updates
-        for widget in [
-            self.prefix_input, self.suffix_input, self.base_input, self.start_input,
-            self.ext_filter_input, self.size_value, self.date_value
-        ]:
-            widget.textChanged.connect(self.preview_callback)
+        self._wire_preview()
         
         # Connect start number field to update visual styling
         self.start_input.textChanged.connect(self._update_start_number_styling)
@@ -729,64 +564,277 @@ class TopPanel(QWidget):
         # Update initial styling
         self._update_start_number_styling()
 
-        self.size_operator.currentIndexChanged.connect(self.preview_callback)
-        self.size_unit.currentIndexChanged.connect(self.preview_callback)
-        self.date_operator.currentIndexChanged.connect(self.preview_callback)
-        self.status_filter.currentIndexChanged.connect(self.preview_callback)
-        self.extension_lock_checkbox.stateChanged.connect(self.preview_callback)
-        
-        # Connect auto-clean controls
-        self.remove_special_chars_check.stateChanged.connect(self.preview_callback)
-        self.replace_spaces_check.stateChanged.connect(self.preview_callback)
-        self.convert_case_check.stateChanged.connect(self.preview_callback)
-        self.remove_accents_check.stateChanged.connect(self.preview_callback)
-        self.case_type_combo.currentIndexChanged.connect(self._on_case_type_changed)
-        
-        # Connect search functionality
-        self.search_input.textChanged.connect(self.preview_callback)
-        
         # Connect export functionality
         self.export_btn.clicked.connect(self.export_preview)
         
         # Helper: set localized empty overlay text
         self._empty_state = "no_files"
         def _set_empty_overlay_text_local():
-            try:
-                # Choose copy by empty state
-                if getattr(self, "_empty_state", "no_files") == "no_matches":
-                    text = self.tr_manager.tr("top_panel.preview.no_files_found")
-                    if text == "top_panel.preview.no_files_found":
-                        text = self.tr_manager.tr("ui.no_files_found")
-                    # hide icon for no results
-                    if hasattr(self, "_empty_icon"):
-                        self._empty_icon.setVisible(False)
-                else:
-                    text = self.tr_manager.tr("top_panel.preview.empty_hint")
-                    if text == "top_panel.preview.empty_hint":
-                        text = self.tr_manager.tr("ui.empty_hint")
-                    if hasattr(self, "_empty_icon"):
-                        self._empty_icon.setText("📂")
-                        self._empty_icon.setVisible(True)
-                if hasattr(self, "_empty_text"):
-                    self._empty_text.setText(text)
-            except Exception:
-                if hasattr(self, "_empty_text"):
-                    self._empty_text.setText(self.tr_manager.tr("ui.empty_hint"))
+            # Choose copy by empty state
+            if self._empty_state == "no_matches":
+                text = self.tr_manager.tr("top_panel.preview.no_files_found")
+                if text == "top_panel.preview.no_files_found":
+                    text = self.tr_manager.tr("ui.no_files_found")
+                # hide icon for no results
+                self._empty_icon.setVisible(False)
+            else:
+                text = self.tr_manager.tr("top_panel.preview.empty_hint")
+                if text == "top_panel.preview.empty_hint":
+                    text = self.tr_manager.tr("ui.empty_hint")
+                self._empty_icon.setText("📂")
+                self._empty_icon.setVisible(True)
+            self._empty_text.setText(text)
         self._set_empty_overlay_text = _set_empty_overlay_text_local
         # Set initial text now that helper exists
         self._set_empty_overlay_text()
 
+    def _build_auto_group(self, group):
+        """Build the auto-clean controls inside the auto-clean group."""
+        # Auto-clean checkboxes
+        self.remove_special_chars_check = CustomCheckBox(self.tr_manager.tr("top_panel.auto_clean.remove_special_chars"))
+        self.replace_spaces_check = CustomCheckBox(self.tr_manager.tr("top_panel.auto_clean.replace_spaces"))
+        self.convert_case_check = CustomCheckBox(self.tr_manager.tr("top_panel.auto_clean.convert_case"))
+        self.remove_accents_check = CustomCheckBox(self.tr_manager.tr("top_panel.auto_clean.remove_accents"))
+        
+        # Case conversion dropdown
+        self.case_type_combo = CustomComboBox()
+        self.case_type_combo.addItems([
+            self.tr_manager.tr("top_panel.auto_clean.case_types.lowercase"),
+            self.tr_manager.tr("top_panel.auto_clean.case_types.titlecase"),
+            self.tr_manager.tr("top_panel.auto_clean.case_types.uppercase")
+        ])
+        # Default to Titlecase
+        try:
+            _title_txt = self.tr_manager.tr("top_panel.auto_clean.case_types.titlecase")
+            _idx = self.case_type_combo.findText(_title_txt)
+            if _idx >= 0:
+                self.case_type_combo.setCurrentIndex(_idx)
+        except Exception:
+            pass
+        # Set size policy to prevent cutoff
+        self.case_type_combo.setSizePolicy(_SP_EXPANDING_FIXED)
+        # Keep dropdown enabled always; selecting a value can auto-enable the checkbox
+        
+        # Row1 inside auto-clean: Special Chars
+        ac_row1 = QHBoxLayout()
+        ac_row1.setSpacing(8)
+        ac_row1.addWidget(self.remove_special_chars_check)
+
+        # Row2: Replace Spaces
+        ac_row2 = QHBoxLayout()
+        ac_row2.setSpacing(8)
+        ac_row2.addWidget(self.replace_spaces_check)
+
+        # Row3: Remove Accents
+        ac_row3 = QHBoxLayout()
+        ac_row3.setSpacing(8)
+        ac_row3.addWidget(self.remove_accents_check)
+
+        # Row4: Convert Case + case type dropdown
+        ac_row4 = QHBoxLayout()
+        ac_row4.setSpacing(8)
+        ac_row4.addWidget(self.convert_case_check)
+        ac_row4.addWidget(self.case_type_combo)
+        ac_row4.addStretch()
+
+        # Compose nested auto-clean group
+        auto_group_layout = QVBoxLayout()
+        auto_group_layout.setSpacing(8)
+        auto_group_layout.addLayout(ac_row1)
+        auto_group_layout.addLayout(ac_row2)
+        auto_group_layout.addLayout(ac_row3)
+        auto_group_layout.addLayout(ac_row4)
+        group.setLayout(auto_group_layout)
+
+    def _build_profiles_group(self, group):
+        """Build the profile selector and buttons inside the profiles group."""
+        self.profile_combo = CustomComboBox()
+        self.profile_combo.setPlaceholderText(self.tr_manager.tr("top_panel.profiles.select_profile_placeholder"))
+        # Set size policy to prevent cutoff
+        self.profile_combo.setSizePolicy(_SP_EXPANDING_FIXED)
+        self.btn_save_profile = QPushButton(self.tr_manager.tr("top_panel.profiles.save"))
+        self.btn_save_profile.setObjectName("SecondaryButton")
+        self.btn_load_profile = QPushButton(self.tr_manager.tr("top_panel.profiles.load"))
+        self.btn_load_profile.setObjectName("SecondaryButton")
+        self.btn_delete_profile = QPushButton(self.tr_manager.tr("top_panel.profiles.delete"))
+        self.btn_delete_profile.setObjectName("SecondaryButton")
+        
+        # Connect profile buttons
+        self.btn_save_profile.clicked.connect(self._on_save_profile)
+        self.btn_load_profile.clicked.connect(self._on_load_profile)
+        self.btn_delete_profile.clicked.connect(self._on_delete_profile)
+        
+        profiles_group_layout = QVBoxLayout()
+        profiles_group_layout.setSpacing(8)
+        # Row1: profile combo full width
+        profile_row1 = QHBoxLayout()
+        profile_row1.setSpacing(8)
+        profile_row1.addWidget(self.profile_combo, 1)
+        profiles_group_layout.addLayout(profile_row1)
+        # Row2: Save + Load
+        profile_row2 = QHBoxLayout()
+        profile_row2.setSpacing(8)
+        profile_row2.addWidget(self.btn_save_profile)
+        profile_row2.addWidget(self.btn_load_profile)
+        profiles_group_layout.addLayout(profile_row2)
+        # Row3: Delete full width
+        profiles_group_layout.addWidget(self.btn_delete_profile)
+        group.setLayout(profiles_group_layout)
+
+    def _build_filters_group(self, group):
+        """Build the filter inputs inside the filters group."""
+        # Extension filter
+        self.ext_filter_input = QLineEdit()
+        self.ext_filter_input.setPlaceholderText(self.tr_manager.tr("top_panel.filters.extension_placeholder"))
+        
+        # Size filter group
+        self.size_operator = CustomComboBox()
+        # Use human-readable operators in UI
+        self.size_operator.addItems([
+            self.tr_manager.tr("ui.size_operators.greater_than"),
+            self.tr_manager.tr("ui.size_operators.less_than"),
+            self.tr_manager.tr("ui.size_operators.equal")
+        ])
+        # Set size policy to prevent cutoff
+        self.size_operator.setSizePolicy(_SP_EXPANDING_FIXED)
+        self.size_value = QLineEdit()
+        self.size_value.setPlaceholderText(self.tr_manager.tr("top_panel.filters.size_placeholder"))
+        # Allow the size value field to expand on smaller displays
+        self.size_value.setSizePolicy(_SP_EXPANDING_FIXED)
+        self.size_unit = CustomComboBox()
+        # Use standard abbreviations to match tests
+        self.size_unit.addItems(["B", "KB", "MB", "GB"])
+        # Set minimum width to prevent text truncation
+        self.size_unit.setMinimumWidth(60)
+        # Set size policy to prevent cutoff
+        self.size_unit.setSizePolicy(_SP_EXPANDING_FIXED)
+        
+        # Date filter group
+        self.date_operator = CustomComboBox()
+        self.date_operator.addItems([
+            self.tr_manager.tr("top_panel.filters.date_operators.before"),
+            self.tr_manager.tr("top_panel.filters.date_operators.after")
+        ])
+        # Set size policy to prevent cutoff
+        self.date_operator.setSizePolicy(_SP_EXPANDING_FIXED)
+        from .date_input import DateInput
+        self.date_value = DateInput()
+        # Connect date validation signal to show notifications
+        self.date_value.date_validation_changed.connect(self._on_date_validation_changed)
+        
+        # Status filter
+        self.status_filter = CustomComboBox()
+        self._populate_status_filter()
+        # Set size policy to prevent cutoff
+        self.status_filter.setSizePolicy(_SP_EXPANDING_FIXED)
+        self.status_filter.setCurrentIndex(0)  # Set to "All" by default
+        
+        filters_group_layout = QVBoxLayout()
+        filters_group_layout.setSpacing(8)
+        # Row1: Extension filter full width
+        ext_row = QHBoxLayout()
+        ext_row.setSpacing(8)
+        ext_row.addWidget(self.ext_filter_input, 1)
+        filters_group_layout.addLayout(ext_row)
+        # Row2: Size operator + value (unit moved to status row for space)
+        size_row = QHBoxLayout()
+        size_row.setSpacing(8)
+        size_row.addWidget(self.size_operator)
+        size_row.addWidget(self.size_value, 1)
+        # Row3: Date operator + value
+        date_row = QHBoxLayout()
+        date_row.setSpacing(8)
+        date_row.addWidget(self.date_operator)
+        date_row.addWidget(self.date_value, 1)
+        # Add Date row before Size row
+        filters_group_layout.addLayout(date_row)
+        # Now add Size row
+        filters_group_layout.addLayout(size_row)
+        # Row4: Status filter with unit dropdown to the right
+        status_row = QHBoxLayout()
+        status_row.setSpacing(8)
+        status_row.addWidget(self.status_filter, 1)
+        status_row.addWidget(self.size_unit)
+        filters_group_layout.addLayout(status_row)
+        group.setLayout(filters_group_layout)
+
+    def _ensure_history_panel(self):
+        """Build the history panel in place of its placeholder; safe to call repeatedly."""
+        if self._history_panel is None:
+            from app.ui.history_panel import HistoryPanel
+            panel = HistoryPanel()
+            self._bottom_layout.replaceWidget(self._history_placeholder, panel)
+            self._history_placeholder.deleteLater()
+            self._history_placeholder = None
+            panel.setVisible(self._history_visible)
+            if self._history_theme:
+                panel.update_theme(self._history_theme)
+            self._history_panel = panel
+        return self._history_panel
+
+    @property
+    def history_panel(self):
+        return self._ensure_history_panel()
+
+    def has_history_panel(self) -> bool:
+        return self._history_panel is not None
+
+    def set_history_visible(self, visible: bool):
+        self._history_visible = bool(visible)
+        widget = self._history_panel if self._history_panel is not None else self._history_placeholder
+        widget.setVisible(self._history_visible)
+
+    def update_history_theme(self, theme: str):
+        """Apply the theme to the history panel now, or when it gets built."""
+        self._history_theme = theme
+        if self._history_panel is not None:
+            self._history_panel.update_theme(theme)
+
+    def update_history(self, history):
+        """Show the rename history; the panel is only built once there is something to show."""
+        if history or self._history_panel is not None:
+            self._ensure_history_panel().update_history(history)
+
+    def get_checked_history_indices(self):
+        if self._history_panel is None:
+            return []
+        return self._history_panel.get_checked_indices()
+
+    def _rebuild_lock_texts(self):
+        """Translate the extension lock on/off captions once per language."""
+        self._lock_on_text = "🔒 " + self.tr_manager.tr("top_panel.naming.extension_lock_active")
+        self._lock_off_text = "🔓 " + self.tr_manager.tr("top_panel.naming.extension_lock_disabled")
+
+    @Slot()
+    def _update_lock_text(self):
+        self.extension_lock_checkbox.setText(
+            self._lock_on_text if self.extension_lock_checkbox.isChecked() else self._lock_off_text
+        )
+
+    @Slot()
+    def _kick_preview(self):
+        """Schedule a preview refresh; changes within the debounce interval coalesce."""
+        self._preview_debounce.start(self._INPUT_DEBOUNCE_MS)
+
+    @Slot()
+    def _debounced_preview(self):
+        """Schedule a preview refresh after a pause in typing."""
+        self._preview_debounce.start(self._TEXT_DEBOUNCE_MS)
+
+    def flush_pending_preview(self):
+        """Run a scheduled preview refresh immediately, if one is pending."""
+        if self._preview_debounce.isActive():
+            self._preview_debounce.stop()
+            self.preview_callback()
+
     def set_empty_state(self, state: str):
         """Set the empty overlay state.
         Allowed: 'no_files' (drag-drop), 'no_matches' (not found), 'hidden' (suppress overlay).
         """
         state = state if state in ("no_files", "no_matches", "hidden") else "no_files"
-        if getattr(self, "_empty_state", None) != state:
+        if self._empty_state != state:
             self._empty_state = state
-            try:
-                self._set_empty_overlay_text()
-            except Exception:
-                pass
+            self._set_empty_overlay_text()
 
     # Public: enable/disable tooltips globally for this panel
     def apply_tooltips(self, enabled: bool):
@@ -806,37 +854,29 @@ class TopPanel(QWidget):
                 self.extension_lock_checkbox.setToolTip("")
         except Exception:
             pass
-    
-    def _create_status_badge(self, status_text):
-        """Create a minimal colored badge for Status: simple and effective."""
-        badge = QLabel(status_text)
-        badge.setAlignment(Qt.AlignCenter)
-        badge.setProperty("status_text", status_text)
-        
-        # Map both English and German status values to colors
-        color_map = {
-            # English status values
-            "Ready": ("#16A34A", "#FFFFFF"),            # green
-            "Conflict": ("#DC2626", "#FFFFFF"),         # red
-            "No Change": ("#D97706", "#111827"),        # amber
-            "Extension Locked": ("#F59E0B", "#111827"), # orange
-            # German status values
-            "Bereit": ("#16A34A", "#FFFFFF"),           # green
-            "Konflikt": ("#DC2626", "#FFFFFF"),         # red
-            "Keine Änderung": ("#D97706", "#111827"),   # amber
-            "Erweiterung gesperrt": ("#F59E0B", "#111827") # orange
-        }
-        bg, fg = color_map.get(status_text, ("#E5E7EB", "#111827"))
-        badge.setStyleSheet(
-            f"QLabel {{ background: {bg}; color: {fg}; border-radius: 6px; padding: 2px 6px; font-weight: 500; }}"
-        )
-        return badge
+        self._push_status_text()
     
     def update_language(self):
         """Update all text with current language."""
         # Temporarily disconnect signals to prevent preview updates during language change
         self._disconnect_preview_signals()
-        
+        # Retranslate with repaints and combo signals held back, then lay out once
+        combos = [self.size_operator, self.size_unit, self.date_operator, self.status_filter,
+                  self.case_type_combo]
+        self.setUpdatesEnabled(False)
+        blockers = [QSignalBlocker(combo) for combo in combos]
+        try:
+            self._retranslate()
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+            self.setUpdatesEnabled(True)
+            self.layout().activate()
+        # Reconnect signals after language update is complete
+        self._reconnect_preview_signals()
+
+    def _retranslate(self):
+        """Set every text of the panel from the current language."""
         # Update buttons
         self.btn_browse_folder.setText(self.tr_manager.tr("main.browse_folder"))
         self.btn_browse_files.setText(self.tr_manager.tr("main.select_files"))
@@ -872,42 +912,22 @@ class TopPanel(QWidget):
         self.btn_save_profile.setText(self.tr_manager.tr("top_panel.profiles.save"))
         self.btn_load_profile.setText(self.tr_manager.tr("top_panel.profiles.load"))
         self.btn_delete_profile.setText(self.tr_manager.tr("top_panel.profiles.delete"))
+        self.profile_combo.setPlaceholderText(self.tr_manager.tr("top_panel.profiles.select_profile_placeholder"))
         
         # Update placeholders
-        self.profile_combo.setPlaceholderText(self.tr_manager.tr("top_panel.profiles.select_profile_placeholder"))
         self.ext_filter_input.setPlaceholderText(self.tr_manager.tr("top_panel.filters.extension_placeholder"))
         self.size_value.setPlaceholderText(self.tr_manager.tr("top_panel.filters.size_placeholder"))
         
         # Update extension lock checkbox
-        if self.extension_lock_checkbox.isChecked():
-            self.extension_lock_checkbox.setText("🔒 " + self.tr_manager.tr("top_panel.naming.extension_lock_active"))
-        else:
-            self.extension_lock_checkbox.setText("🔓 " + self.tr_manager.tr("top_panel.naming.extension_lock_disabled"))
+        self._rebuild_lock_texts()
+        self._update_lock_text()
         
         # Update auto-clean controls
-        self.remove_special_chars_check.setText(self.tr_manager.tr("top_panel.auto_clean.remove_special_chars"))
-        self.replace_spaces_check.setText(self.tr_manager.tr("top_panel.auto_clean.replace_spaces"))
-        self.convert_case_check.setText(self.tr_manager.tr("top_panel.auto_clean.convert_case"))
-        self.remove_accents_check.setText(self.tr_manager.tr("top_panel.auto_clean.remove_accents"))
-        
-        # Update case type combo
-        prev_case = self.case_type_combo.currentText() if hasattr(self, "case_type_combo") else ""
-        self.case_type_combo.clear()
-        items = [
-            self.tr_manager.tr("top_panel.auto_clean.case_types.lowercase"),
-            self.tr_manager.tr("top_panel.auto_clean.case_types.titlecase"),
-            self.tr_manager.tr("top_panel.auto_clean.case_types.uppercase")
-        ]
-        self.case_type_combo.addItems(items)
-        # Restore previous selection if possible; otherwise default to Titlecase
-        try:
-            restore_txt = prev_case if prev_case in items else self.tr_manager.tr("top_panel.auto_clean.case_types.titlecase")
-            idx = self.case_type_combo.findText(restore_txt)
-            if idx >= 0:
-                self.case_type_combo.setCurrentIndex(idx)
-        except Exception:
-            pass
+        self._update_auto_group_language()
         
+        # Status labels feed the preview badges and the status filter
+        self._rebuild_status_labels()
+
         # Update table headers
         self.table.setHorizontalHeaderLabels([
             self.tr_manager.tr("top_panel.preview.old_name"),
@@ -921,13 +941,34 @@ class TopPanel(QWidget):
         # Update export button
         self.export_btn.setText(self.tr_manager.tr("top_panel.preview.export_preview"))
         
-        # Update empty-state text if overlay exists
-        try:
-            self._set_empty_overlay_text()
-        except Exception:
-            pass
+        # Update empty-state text
+        self._set_empty_overlay_text()
         
         # Update filter options
+        self._update_filters_group_language()
+
+    def _update_auto_group_language(self):
+        """Retranslate the auto-clean controls."""
+        self.remove_special_chars_check.setText(self.tr_manager.tr("top_panel.auto_clean.remove_special_chars"))
+        self.replace_spaces_check.setText(self.tr_manager.tr("top_panel.auto_clean.replace_spaces"))
+        self.convert_case_check.setText(self.tr_manager.tr("top_panel.auto_clean.convert_case"))
+        self.remove_accents_check.setText(self.tr_manager.tr("top_panel.auto_clean.remove_accents"))
+        
+        # Update case type combo; item order is the same in every language,
+        # so the previous selection is restored by position (Titlecase if none)
+        prev_idx = self.case_type_combo.currentIndex()
+        self.case_type_combo.clear()
+        self.case_type_combo.addItems([
+            self.tr_manager.tr("top_panel.auto_clean.case_types.lowercase"),
+            self.tr_manager.tr("top_panel.auto_clean.case_types.titlecase"),
+            self.tr_manager.tr("top_panel.auto_clean.case_types.uppercase")
+        ])
+        self.case_type_combo.setCurrentIndex(prev_idx if prev_idx >= 0 else 1)
+
+    def _update_filters_group_language(self):
+        """Retranslate the filter combo options, keeping each selection by position."""
+        prev = [combo.currentIndex() for combo in
+                (self.size_operator, self.size_unit, self.date_operator, self.status_filter)]
         self.size_operator.clear()
         self.size_operator.addItems([
             self.tr_manager.tr("ui.size_operators.greater_than"),
@@ -945,342 +986,199 @@ class TopPanel(QWidget):
         ])
         
         self.status_filter.clear()
-        self.status_filter.addItems([
-            self.tr_manager.tr("top_panel.filters.status_options.all"),
-            self.tr_manager.tr("ui.status_options.ready"),
-            self.tr_manager.tr("ui.status_options.conflict"),
-            self.tr_manager.tr("ui.status_options.no_change"),
-            self.tr_manager.tr("ui.status_options.extension_locked")
-        ])
-        
-        # Reconnect signals after language update is complete
-        self._reconnect_preview_signals()
+        self._populate_status_filter()
+
+        for combo, idx in zip((self.size_operator, self.size_unit, self.date_operator, self.status_filter), prev):
+            combo.setCurrentIndex(max(idx, 0))
+
+    def _populate_status_filter(self):
+        """Fill the status filter; item data is the Status to keep (None for "All")."""
+        self.status_filter.addItem(self.tr_manager.tr("top_panel.filters.status_options.all"), None)
+        for status, label in zip(Status, self._status_labels):
+            self.status_filter.addItem(label, status)
+
+    def _rebuild_status_labels(self):
+        """Translate the status labels and tooltips once per language."""
+        keys = ("ready", "conflict", "no_change", "extension_locked")
+        self._status_labels = tuple(self.tr_manager.tr(f"ui.status_options.{key}") for key in keys)
+        self._status_tooltips = tuple(self.tr_manager.tr(f"ui.status_{key}_tooltip") for key in keys)
+        self._preview_data = None
+        self._push_status_text()
+
+    def _push_status_text(self):
+        """Hand the translated status texts to the table model."""
+        tooltips = self._status_tooltips if self._tooltips_enabled else None
+        self.table.itemDelegateForColumn(2).clear_cache()
+        self.table.model().set_status_text(self._status_labels, tooltips)
+
+    def _wire_preview(self):
+        """Bind every _PREVIEW_WIRES entry."""
+        for attr, signal_name, slot_name in self._PREVIEW_WIRES:
+            self._bind(getattr(getattr(self, attr), signal_name), getattr(self, slot_name))
+
+    def _bind(self, signal, slot):
+        """Connect a preview-triggering signal and record it for disconnect/reconnect."""
+        self._preview_binds.append((signal, slot))
+        if self._preview_wired:
+            signal.connect(slot, Qt.UniqueConnection)
 
     def _disconnect_preview_signals(self):
-        """Temporarily disconnect only our preview-callback bindings.
-        Avoid removing internal handlers (e.g., DateInput auto-format).
+        """Temporarily disconnect only our preview bindings.
+        Internal handlers (e.g., DateInput auto-format) stay connected.
         """
-        # Disconnect combo box signals (preview only)
-        try: self.size_operator.currentIndexChanged.disconnect(self.preview_callback)
-        except Exception: pass
-        try: self.size_unit.currentIndexChanged.disconnect(self.preview_callback)
-        except Exception: pass
-        try: self.date_operator.currentIndexChanged.disconnect(self.preview_callback)
-        except Exception: pass
-        try: self.status_filter.currentIndexChanged.disconnect(self.preview_callback)
-        except Exception: pass
-        try: self.case_type_combo.currentIndexChanged.disconnect(self._on_case_type_changed)
-        except Exception: pass
-
-        # Disconnect checkbox signals (preview only)
-        try: self.extension_lock_checkbox.stateChanged.disconnect(self.preview_callback)
-        except Exception: pass
-        try: self.remove_special_chars_check.stateChanged.disconnect(self.preview_callback)
-        except Exception: pass
-        try: self.replace_spaces_check.stateChanged.disconnect(self.preview_callback)
-        except Exception: pass
-        try: self.convert_case_check.stateChanged.disconnect(self.preview_callback)
-        except Exception: pass
-        try: self.remove_accents_check.stateChanged.disconnect(self.preview_callback)
-        except Exception: pass
-
-        # Disconnect text input signals (preview only) — don't nuke internal handlers
-        try: self.prefix_input.textChanged.disconnect(self.preview_callback)
-        except Exception: pass
-        try: self.suffix_input.textChanged.disconnect(self.preview_callback)
-        except Exception: pass
-        try: self.base_input.textChanged.disconnect(self.preview_callback)
-        except Exception: pass
-        try: self.start_input.textChanged.disconnect(self.preview_callback)
-        except Exception: pass
-        try: self.ext_filter_input.textChanged.disconnect(self.preview_callback)
-        except Exception: pass
-        try: self.size_value.textChanged.disconnect(self.preview_callback)
-        except Exception: pass
-        try: self.date_value.textChanged.disconnect(self.preview_callback)
-        except Exception: pass
-        try: self.search_input.textChanged.disconnect(self.preview_callback)
-        except Exception: pass
+        if self._preview_wired:
+            self._preview_wired = False
+            for signal, slot in self._preview_binds:
+                signal.disconnect(slot)
     
     def _reconnect_preview_signals(self):
         """Reconnect signals that trigger preview updates."""
-        # Reconnect combo box signals
-        self.size_operator.currentIndexChanged.connect(self.preview_callback)
-        self.size_unit.currentIndexChanged.connect(self.preview_callback)
-        self.date_operator.currentIndexChanged.connect(self.preview_callback)
-        self.status_filter.currentIndexChanged.connect(self.preview_callback)
-        self.case_type_combo.currentIndexChanged.connect(self._on_case_type_changed)
-        
-        # Reconnect checkbox signals
-        self.extension_lock_checkbox.stateChanged.connect(self.preview_callback)
-        self.remove_special_chars_check.stateChanged.connect(self.preview_callback)
-        self.replace_spaces_check.stateChanged.connect(self.preview_callback)
-        self.convert_case_check.stateChanged.connect(self.preview_callback)
-        self.remove_accents_check.stateChanged.connect(self.preview_callback)
-        
-        # Reconnect text input signals
-        for widget in [
-            self.prefix_input, self.suffix_input, self.base_input, self.start_input,
-            self.ext_filter_input, self.size_value, self.date_value
-        ]:
-            widget.textChanged.connect(self.preview_callback)
-        
-        # Reconnect search input
-        self.search_input.textChanged.connect(self.preview_callback)
-        
-        # Reconnect start number specific signals
-        self.start_input.textChanged.connect(self._update_start_number_styling)
-        self.start_input.textChanged.connect(self._maintain_start_number_focus)
+        if not self._preview_wired:
+            self._preview_wired = True
+            for signal, slot in self._preview_binds:
+                signal.connect(slot, Qt.UniqueConnection)
 
     def update_preview(self, preview_list):
+        # This refresh supersedes any scheduled one
+        self._preview_debounce.stop()
+        # Sort first (cached while rows and sort order are unchanged); filtering keeps the order
+        sorted_preview_list = self._sorted_preview(preview_list)
+        
         # Apply search filter
         search_term = self.search_input.text().strip().lower()
         if search_term:
-            filtered_preview_list = []
-            for item in preview_list:
-                old_name, new_name, status, _ = item
-                if (search_term in old_name.lower() or 
-                    search_term in new_name.lower() or 
-                    self._matches_status(search_term, status)):
-                    filtered_preview_list.append(item)
-            preview_list = filtered_preview_list
-        
-        # Sort the preview data
-        sorted_preview_list = self.sort_preview_data(preview_list)
-        
-        # Store full list and reset rendered rows for lazy loading
-        self._full_preview_data = sorted_preview_list
-        self._rendered_rows = 0
-        self.table.setRowCount(0)
-        # Toggle empty-state overlay visibility for both no files and filters yielding no rows
-        try:
-            if hasattr(self.table, "_empty_overlay") and self.table._empty_overlay is not None:
-                if hasattr(self.table, "_reposition_overlay") and callable(self.table._reposition_overlay):
-                    self.table._reposition_overlay()
-                # Show overlay only when state is not 'hidden'
-                show = getattr(self, "_empty_state", "no_files") != "hidden" and len(self._full_preview_data) == 0
-                self.table._empty_overlay.setVisible(show)
-        except Exception:
-            pass
-        # Render first batch
-        self._append_rows()
-
-    def _matches_status(self, search_term: str, status: str) -> bool:
-        """Check if search term matches status in any language."""
-        # Define status mappings for both languages
-        status_mappings = {
-            # English status values
-            "renamed": ["renamed", "umbenannt"],
-            "unchanged": ["unchanged", "unverändert"], 
-            "error": ["error", "fehler"],
-            "duplicate": ["duplicate", "duplikat"],
-            "invalid": ["invalid", "ungültig"],
-            "ready": ["ready", "bereit"],
-            "no change": ["no change", "keine änderung"],
-            "conflict": ["conflict", "konflikt"],
-            "extension locked": ["extension locked", "erweiterung gesperrt"],
-            # German status values
-            "umbenannt": ["renamed", "umbenannt"],
-            "unverändert": ["unchanged", "unverändert"],
-            "fehler": ["error", "fehler"],
-            "duplikat": ["duplicate", "duplikat"],
-            "ungültig": ["invalid", "ungültig"],
-            "bereit": ["ready", "bereit"],
-            "keine änderung": ["no change", "keine änderung"],
-            "konflikt": ["conflict", "konflikt"],
-            "erweiterung gesperrt": ["extension locked", "erweiterung gesperrt"]
-        }
-        
-        # Check if search term matches any of the status values
-        status_lower = status.lower()
-        for key, values in status_mappings.items():
-            if search_term in key and status_lower in values:
-                return True
-            if search_term in status_lower:
-                return True
-        
-        return False
-
-    def _translate_status(self, status: str) -> str:
-        """Translate status value to current language."""
-        from app.utils.translation_manager import get_translation_manager
-        tr_manager = get_translation_manager()
-        
-        # Map English status values to translation keys
-        status_map = {
-            "Ready": "status.ready",
-            "Conflict": "status.conflict", 
-            "No Change": "status.no_change",
-            "Extension Locked": "status.extension_locked",
-            "Error": "status.error",
-            "Duplicate": "status.duplicate",
-            "Invalid": "status.invalid"
-        }
-        
-        # Return translated status or original if no translation found
-        return tr_manager.tr(status_map.get(status, status))
+            matches = self._matches_status
+            sorted_preview_list = [
+                item for item, (old_lower, new_lower, status_lower)
+                in zip(sorted_preview_list, self._lowered_columns(sorted_preview_list))
+                if search_term in old_lower or search_term in new_lower or matches(search_term, status_lower)
+            ]
+        
+        if sorted_preview_list == self._shown_preview:
+            # Same rows as on screen (e.g. a refresh after a change with no effect); keep
+            # the view and its selection, only the empty state may differ
+            self._sync_view()
+            return
+        self._shown_preview = sorted_preview_list
+        
+        # Store the columns and let the model reset the view; repaint once at the end
+        self.table.setUpdatesEnabled(False)
+        self._set_preview_columns(sorted_preview_list)
+        self.table.model().set_rows(self._old_names, self._new_names, self._statuses, self._paths, self._suggestions)
+        self.table._anchor_row = None
+        # A model reset clears the selection without emitting selectionChanged
+        self._on_table_selection_changed()
+        self._sync_view()
+        self.table.setUpdatesEnabled(True)
 
-    def _append_rows(self):
-        if not self._full_preview_data:
+    def _sync_view(self):
+        """Place the empty overlay for the current rows.
+
+        Placement depends on the view geometry, so while the panel is hidden (e.g.
+        profile loads before the window is shown) the work waits for showEvent.
+        """
+        if not self.isVisible():
+            self._view_stale = True
             return
-        start = self._rendered_rows
-        end = min(len(self._full_preview_data), start + self._batch_size)
-        if start >= end:
-            self.table.show_loading(False)
+        self._view_stale = False
+        self._update_empty_overlay()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._view_stale:
+            self._sync_view()
+
+    def _update_empty_overlay(self):
+        """Toggle empty-state overlay visibility for both no files and filters yielding no rows."""
+        overlay = self.table._empty_overlay
+        if overlay is None:
             return
-        self.table.show_loading(True)
-        self.table.setRowCount(end)
-        extension_locked = self.extension_lock_checkbox.isChecked()
-        for row in range(start, end):
-            old_name, new_name, status, _ = self._full_preview_data[row]
-            old_item = QTableWidgetItem(old_name)
-            new_item = QTableWidgetItem(new_name)
-            old_item.setTextAlignment(Qt.AlignVCenter | Qt.AlignLeft)
-            new_item.setTextAlignment(Qt.AlignVCenter | Qt.AlignLeft)
-            # Parse status and optional auto-resolved suggestion
-            suggestion = None
-            status_text = status
-            if isinstance(status, str) and "|" in status:
-                parts = status.split("|", 1)
-                status_text = parts[0]
-                suggestion = parts[1]
-            
-            # Translate status text
-            status_text = self._translate_status(status_text)
-            # Keep the status as widget-only to avoid duplicate text rendering
-            status_item = QTableWidgetItem("")
-            # Attach original file path to the first column for removal
-            try:
-                old_item.setData(Qt.UserRole, _)
-            except Exception:
-                pass
-
-            old_item.setFlags(old_item.flags() & ~Qt.ItemIsEditable)
-            new_item.setFlags(new_item.flags() & ~Qt.ItemIsEditable)
-            status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
-
-            # Apply colors based on original status (before translation)
-            if status == "Ready":
-                new_item.setForeground(QBrush(QColor(0, 128, 0)))
-                if extension_locked:
-                    new_item.setToolTip("🔒 Extension preserved automatically")
-            elif status == "Conflict":
-                new_item.setForeground(QBrush(QColor(200, 0, 0)))
-            elif status == "No Change":
-                new_item.setForeground(QBrush(QColor(180, 150, 0)))
-            elif status == "Extension Locked":
-                new_item.setForeground(QBrush(QColor(255, 140, 0)))
-                new_item.setToolTip("🔒 Extension lock is enabled - extension changes are not allowed")
-
-            self.table.setItem(row, 0, old_item)
-            self.table.setItem(row, 1, new_item)
-            # Status column (now at index 2)
-            # Ensure the textual item is empty, and use a widget for the visual badge
-            self.table.setItem(row, 2, status_item)
-            # Put the badge inside a container; only the badge text should appear
-            try:
-                from PySide6.QtWidgets import QWidget, QHBoxLayout
-                wrap = QWidget()
-                wrap.setStyleSheet("background: transparent;")
-                hl = QHBoxLayout(wrap)
-                hl.setContentsMargins(0, 0, 0, 0)
-                hl.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                badge = self._create_status_badge(status_text)
-                # Size badge to fit text (with padding) so it doesn't cut off (e.g., "No Change")
-                try:
-                    fm = badge.fontMetrics()
-                    text_w = fm.horizontalAdvance(status_text) + 18  # padding from stylesheet
-                    max_w = max(80, self.table.columnWidth(2) - 12)
-                    badge.setFixedWidth(min(max_w, text_w))
-                except Exception:
-                    pass
-                hl.addWidget(badge)
-                # expose status text on the wrapper so export logic can read it
-                wrap.setProperty("status_text", status_text)
-                self.table.setCellWidget(row, 2, wrap)
-            except Exception:
-                w = self._create_status_badge(status_text)
-                w.setProperty("status_text", status_text)
-                self.table.setCellWidget(row, 2, w)
-            # If suggestion exists, show crossed original new name; suggestion text is only in Suggestion column
-            if suggestion and status_text == "Conflict":
-                try:
-                    from PySide6.QtWidgets import QWidget, QHBoxLayout
-                    cont = QWidget()
-                    hl = QHBoxLayout(cont)
-                    hl.setContentsMargins(0, 0, 0, 0)
-                    hl.setSpacing(8)
-                    lbl_old = QLabel(new_name)
-                    lbl_old.setStyleSheet("QLabel { color: #DC2626; text-decoration: line-through; }")
-                    hl.addWidget(lbl_old)
-                    # Accept/Decline buttons
-                    from PySide6.QtWidgets import QPushButton
-                    from functools import partial
-                    accept_btn = QPushButton("✓")
-                    accept_btn.setObjectName("SecondaryButton")
-                    decline_btn = QPushButton("✕")
-                    decline_btn.setObjectName("SecondaryButton")
-                    try:
-                        accept_btn.setFixedWidth(28)
-                        decline_btn.setFixedWidth(28)
-                        accept_btn.setStyleSheet("QPushButton { padding: 0 4px; }")
-                        decline_btn.setStyleSheet("QPushButton { padding: 0 4px; }")
-                    except Exception:
-                        pass
-                    accept_btn.clicked.connect(partial(self._accept_suggestion, row, suggestion))
-                    decline_btn.clicked.connect(partial(self._decline_suggestion, row, new_name))
-                    btn_wrap = QWidget()
-                    btn_wrap.setMinimumWidth(140)
-                    bl = QHBoxLayout(btn_wrap)
-                    bl.setContentsMargins(0, 0, 0, 0)
-                    bl.setSpacing(6)
-                    bl.addWidget(accept_btn)
-                    bl.addWidget(decline_btn)
-                    hl.addWidget(btn_wrap)
-                    self.table.setCellWidget(row, 1, cont)
-                except Exception:
-                    pass
-        self._rendered_rows = end
-        self.table.show_loading(False)
-
-    def _maybe_load_more_rows(self):
-        sb = self.table.verticalScrollBar()
-        if sb.maximum() <= 0:
+        # Show overlay only when state is not 'hidden'
+        show = self._empty_state != "hidden" and not self._old_names
+        if show:
+            self.table._reposition_overlay()
+        overlay.setVisible(show)
+
+    def _sorted_preview(self, preview_list):
+        """Sorted preview, reused while the rows and the sort order are unchanged."""
+        if self.sort_column == -1:
+            return preview_list
+        key = (self.sort_column, self.sort_ascending)
+        # Rows are regenerated on every refresh, so compare content rather than identity
+        if key != self._sort_cache_key or preview_list != self._sort_cache_source:
+            self._sort_cache_key = key
+            self._sort_cache_source = preview_list
+            self._sort_cache_value = self.sort_preview_data(preview_list)
+        return self._sort_cache_value
+
+    def _lowered_columns(self, preview_list):
+        """Lowercased (old, new, status) per row, reused while the preview content is unchanged."""
+        # Searching re-runs the preview with identical rows, so equality (not identity) is the key
+        if preview_list != self._lower_source:
+            self._lower_source = preview_list
+            self._lower_cache = [(o.lower(), n.lower(), s.lower()) for o, n, s, _ in preview_list]
+        return self._lower_cache
+
+    def _matches_status(self, search_term: str, status_lower: str) -> bool:
+        """Check if search term matches a (lowercased) status in any language."""
+        if search_term in status_lower:
+            return True
+        return any(search_term in term for term in _STATUS_INDEX.get(status_lower, ()))
+
+    @property
+    def _full_preview_data(self):
+        """Row-wise (old_name, new_name, status, path) view of the stored preview."""
+        suggestions = self._suggestions
+        return [
+            (old, new, STATUS_TEXT[status] + ("|" + suggestions[row] if row in suggestions else ""), path)
+            for row, (old, new, status, path) in enumerate(
+                zip(self._old_names, self._new_names, self._statuses, self._paths))
+        ]
+
+    def _set_preview_columns(self, preview_list):
+        """Split preview tuples into the parallel column lists, encoding statuses."""
+        self._suggestions = {}
+        self._preview_data = None
+        if not preview_list:
+            self._old_names, self._new_names, self._statuses, self._paths = [], [], [], []
             return
-        if sb.value() > sb.maximum() * 0.8:
-            self._append_rows()
+        old_names, new_names, raw_statuses, paths = zip(*preview_list)
+        statuses = []
+        for row, raw in enumerate(raw_statuses):
+            code = STATUS_FROM_TEXT.get(raw)
+            if code is None:
+                # "Conflict|<suggested name>" from auto-resolve
+                raw, _, suggestion = raw.partition("|")
+                code = STATUS_FROM_TEXT[raw]
+                if suggestion:
+                    self._suggestions[row] = suggestion
+            statuses.append(code)
+        self._old_names = list(old_names)
+        self._new_names = list(new_names)
+        self._statuses = statuses
+        self._paths = list(paths)
 
-    def _accept_suggestion(self, row_idx: int, suggestion: str):
-        try:
-            self.table.setCellWidget(row_idx, 1, None)
-            item = self.table.item(row_idx, 1)
-            if item is None:
-                item = QTableWidgetItem(suggestion)
-                self.table.setItem(row_idx, 1, item)
-            else:
-                item.setText(suggestion)
-            item.setForeground(QBrush(QColor(0, 128, 0)))
-            self.table.setCellWidget(row_idx, 2, None)
-            self.table.setItem(row_idx, 2, QTableWidgetItem(""))
-            self.table.setCellWidget(row_idx, 3, self._create_status_badge("Ready"))
-            self.table.setItem(row_idx, 3, QTableWidgetItem("Ready"))
-        except Exception:
-            pass
+    @Slot(int)
+    def _accept_suggestion(self, row_idx: int):
+        suggestion = self._suggestions.pop(row_idx, None)
+        if suggestion is None:
+            # Already resolved (e.g. the second release of a double click)
+            return
+        self._new_names[row_idx] = suggestion
+        self._statuses[row_idx] = Status.READY
+        self._preview_data = None
+        # The displayed rows no longer match the last preview
+        self._shown_preview = None
+        self.table.model().refresh_row(row_idx, 1, 2)  # new name and status
 
-    def _decline_suggestion(self, row_idx: int, original_new_name: str):
-        try:
-            self.table.setCellWidget(row_idx, 1, None)
-            item = self.table.item(row_idx, 1)
-            if item is None:
-                item = QTableWidgetItem(original_new_name)
-                self.table.setItem(row_idx, 1, item)
-            item.setText(original_new_name)
-            item.setForeground(QBrush(QColor(200, 0, 0)))
-            self.table.setCellWidget(row_idx, 2, None)
-            self.table.setItem(row_idx, 2, QTableWidgetItem(""))
-            # keep status as-is
-        except Exception:
-            pass
+    @Slot(int)
+    def _decline_suggestion(self, row_idx: int):
+        # Keep the generated new name; only the suggestion is dropped
+        if self._suggestions.pop(row_idx, None) is None:
+            return
+        self._shown_preview = None
+        # Status is kept, so only the new-name cell repaints
+        self.table.model().refresh_row(row_idx, 1, 1)
 
     def _on_table_selection_changed(self):
         sel = self.table.selectionModel()
@@ -1294,13 +1192,8 @@ class TopPanel(QWidget):
         if not sel:
             return
         rows = sorted({idx.row() for idx in sel.selectedRows()})
-        file_paths = []
-        for r in rows:
-            item = self.table.item(r, 0)
-            if item is not None:
-                fp = item.data(Qt.UserRole)
-                if fp:
-                    file_paths.append(fp)
+        paths = self._paths
+        file_paths = [paths[r] for r in rows if paths[r]]
         if file_paths:
             self.remove_selected.emit(file_paths)
         self.table.clearSelection()
@@ -1311,15 +1204,13 @@ class TopPanel(QWidget):
         """Handle header click for sorting."""
         if column == self.sort_column:
             # Same column clicked - cycle through: asc -> desc -> no sort
-            if self.sort_ascending:
-                self.sort_ascending = False  # Switch to descending
-            else:
-                self.sort_column = -1  # No sorting
-                self.sort_ascending = True
+            ascending = self._NEXT_SORT_DIRECTION[bool(self.sort_ascending)]
         else:
             # Different column clicked - start with ascending
-            self.sort_column = column
-            self.sort_ascending = True
+            ascending = True
+        if ascending is None:
+            column, ascending = -1, True  # No sorting
+        self.sort_column, self.sort_ascending = column, ascending
         
         # Update header labels with sort indicators
         self._update_header_labels()
@@ -1327,14 +1218,13 @@ class TopPanel(QWidget):
         # Trigger preview update
         self.preview_callback()
 
+    @Slot()
     def _on_case_type_changed(self):
         """Auto-enable convert-case when user picks a case type."""
-        try:
-            if not self.convert_case_check.isChecked():
-                self.convert_case_check.setChecked(True)
-        except Exception:
-            pass
-        self.preview_callback()
+        # Only wired once the auto-clean group (and so the checkbox) exists
+        if not self.convert_case_check.isChecked():
+            self.convert_case_check.setChecked(True)
+        self._kick_preview()
     
     def _on_date_validation_changed(self, is_valid, message):
         """Handle date validation changes and show notifications."""
@@ -1366,22 +1256,17 @@ class TopPanel(QWidget):
         """Update the visual styling of the start number field based on its content."""
         text = self.start_input.text().strip()
         
-        # More robust validation - check if text is a valid positive integer
-        is_valid = False
-        if text:
-            try:
-                # Try to convert to int and check if it's positive
-                num = int(text)
-                is_valid = num > 0
-            except ValueError:
-                is_valid = False
-        
-        if is_valid:
-            # Field is filled with a valid number - use theme styling with specific selector
-            self.start_input.setStyleSheet("QLineEdit#startNumberField { border: 1px solid #D5D5D5; }")
-        else:
-            # Field is empty or invalid - red border to indicate required
-            self.start_input.setStyleSheet("QLineEdit#startNumberField { border: 2px solid #ff6b6b !important; }")
+        # Valid when it's a positive integer: ASCII digits only (no int() round-trip or
+        # ValueError per keystroke) and not all zeros
+        is_valid = text.isascii() and text.isdigit() and text.lstrip("0") != ""
+        
+        # Only re-polish when the state flips; the field's stylesheet picks the border from the property
+        if is_valid != self._start_number_valid:
+            self._start_number_valid = is_valid
+            self.start_input.setProperty("valid", is_valid)
+            style = self.start_input.style()
+            style.unpolish(self.start_input)
+            style.polish(self.start_input)
     
     def _maintain_start_number_focus(self):
         """Maintain focus on start number field when text changes."""
@@ -1394,9 +1279,9 @@ class TopPanel(QWidget):
         # 3. The text was not empty before
         has_focus = self._start_input_has_focus
         if has_focus and not current_text and previous_text:
-            # Use a longer delay to ensure it's after all other events
-            from PySide6.QtCore import QTimer
-            QTimer.singleShot(10, lambda: self.start_input.setFocus())
+            # Queue the slot call so it runs after the events already pending,
+            # without a timer and closure per edit
+            QMetaObject.invokeMethod(self.start_input, "setFocus", Qt.QueuedConnection)
         
         # Update previous text for next comparison
         self._previous_start_text = current_text
@@ -1405,14 +1290,12 @@ class TopPanel(QWidget):
         """Handle focus in event for start number field."""
         self._start_input_has_focus = True
         # Call the original focusInEvent
-        from PySide6.QtWidgets import QLineEdit
         QLineEdit.focusInEvent(self.start_input, event)
     
     def _start_input_focus_out(self, event):
         """Handle focus out event for start number field."""
         self._start_input_has_focus = False
         # Call the original focusOutEvent
-        from PySide6.QtWidgets import QLineEdit
         QLineEdit.focusOutEvent(self.start_input, event)
     
     def sort_preview_data(self, preview_list):
@@ -1420,18 +1303,15 @@ class TopPanel(QWidget):
         if self.sort_column == -1:
             return preview_list  # No sorting
         
-        # Determine sort key based on column
-        if self.sort_column == 0:  # Old Name
-            key_func = lambda x: x[0].lower()
-        elif self.sort_column == 1:  # New Name
-            key_func = lambda x: x[1].lower()
-        elif self.sort_column == 2:  # Status
-            key_func = lambda x: x[2].lower()
-        else:
+        col = self.sort_column
+        if col not in (0, 1, 2):  # Old Name, New Name, Status
             return preview_list
         
-        # Sort with appropriate direction
-        return sorted(preview_list, key=key_func, reverse=not self.sort_ascending)
+        # sorted() calls the key once per row (not per comparison) and stays stable with
+        # reverse=True, so ties keep their original order in both directions. Sorting the
+        # rows directly beats an argsort-style pass over row indices, whose gather step
+        # costs more than the key lambda saves
+        return sorted(preview_list, key=lambda row: row[col].lower(), reverse=not self.sort_ascending)
     
     def _on_save_profile(self):
         """Handle save profile button click."""
@@ -1454,9 +1334,16 @@ class TopPanel(QWidget):
     
     def refresh_profiles_list(self, profiles):
         """Refresh the profiles dropdown list."""
-        self.profile_combo.clear()
-        for profile in profiles:
-            self.profile_combo.addItem(profile)
+        combo = self.profile_combo
+        # One repaint and no currentIndexChanged/currentTextChanged for the transient clear
+        blocker = QSignalBlocker(combo)
+        combo.setUpdatesEnabled(False)
+        try:
+            combo.clear()
+            combo.addItems(list(profiles))
+        finally:
+            combo.setUpdatesEnabled(True)
+            blocker.unblock()
     
     def get_current_settings(self):
         """Get current settings for saving as profile."""
@@ -1483,67 +1370,67 @@ class TopPanel(QWidget):
             "search_term": self.search_input.text()
         }
     
+    def _set_combo_text(self, combo, text):
+        """Select the item matching text, if any; a no-op when it is already current."""
+        if text and combo.currentText() != text:
+            index = combo.findText(text)
+            if index >= 0:
+                combo.setCurrentIndex(index)
+
     def apply_settings(self, settings):
         """Apply settings from a loaded profile."""
-        self.prefix_input.setText(settings.get("prefix", ""))
-        self.suffix_input.setText(settings.get("suffix", ""))
-        self.base_input.setText(settings.get("base_name", ""))
-        self.start_input.setText(settings.get("start_num", ""))
-        # Update styling after setting text
-        self._update_start_number_styling()
-        self.extension_lock_checkbox.setChecked(settings.get("extension_lock", True))
-        self.ext_filter_input.setText(settings.get("extensions", ""))
-        
-        # Set size filter
-        size_op = settings.get("size_operator", "")
-        if size_op:
-            index = self.size_operator.findText(size_op)
-            if index >= 0:
-                self.size_operator.setCurrentIndex(index)
-        self.size_value.setText(settings.get("size_value", ""))
-        size_unit = settings.get("size_unit", "")
-        if size_unit:
-            index = self.size_unit.findText(size_unit)
-            if index >= 0:
-                self.size_unit.setCurrentIndex(index)
-        
-        # Set date filter
-        date_op = settings.get("date_operator", "")
-        if date_op:
-            index = self.date_operator.findText(date_op)
-            if index >= 0:
-                self.date_operator.setCurrentIndex(index)
-        self.date_value.setText(settings.get("date_value", ""))
-        
-        # Set status filter
-        status_filter = settings.get("status_filter", "All")
-        index = self.status_filter.findText(status_filter)
-        if index >= 0:
-            self.status_filter.setCurrentIndex(index)
-        
-        # Set sort settings
-        self.sort_column = settings.get("sort_column", -1)
-        self.sort_ascending = settings.get("sort_ascending", True)
-        self._update_header_labels()
-        
-        # Set auto-clean settings
-        self.remove_special_chars_check.setChecked(settings.get("remove_special_chars", False))
-        self.replace_spaces_check.setChecked(settings.get("replace_spaces", False))
-        self.convert_case_check.setChecked(settings.get("convert_case", False))
-        self.remove_accents_check.setChecked(settings.get("remove_accents", False))
-        
-        # Set case type
-        case_type = settings.get("case_type", "")
-        if case_type:
-            index = self.case_type_combo.findText(case_type)
-            if index >= 0:
-                self.case_type_combo.setCurrentIndex(index)
-        
-        # Set search term
-        self.search_input.setText(settings.get("search_term", ""))
-        
-        # Enable/disable case type combo based on convert_case setting
-        self.case_type_combo.setEnabled(self.convert_case_check.isChecked())
+        # Each setter below would schedule a preview (and a case type would re-check
+        # convert-case); apply them unwired, repaint once, then refresh the preview once
+        was_wired = self._preview_wired
+        self._disconnect_preview_signals()
+        self.setUpdatesEnabled(False)
+        try:
+            self.prefix_input.setText(settings.get("prefix", ""))
+            self.suffix_input.setText(settings.get("suffix", ""))
+            self.base_input.setText(settings.get("base_name", ""))
+            self.start_input.setText(settings.get("start_num", ""))
+            # Update styling after setting text
+            self._update_start_number_styling()
+            self.extension_lock_checkbox.setChecked(settings.get("extension_lock", True))
+            self.ext_filter_input.setText(settings.get("extensions", ""))
+        
+            # Set size filter
+            self._set_combo_text(self.size_operator, settings.get("size_operator", ""))
+            self.size_value.setText(settings.get("size_value", ""))
+            self._set_combo_text(self.size_unit, settings.get("size_unit", ""))
+        
+            # Set date filter
+            self._set_combo_text(self.date_operator, settings.get("date_operator", ""))
+            self.date_value.setText(settings.get("date_value", ""))
+        
+            # Set status filter
+            self._set_combo_text(self.status_filter, settings.get("status_filter", "All"))
+        
+            # Set sort settings
+            self.sort_column = settings.get("sort_column", -1)
+            self.sort_ascending = settings.get("sort_ascending", True)
+            self._update_header_labels()
+        
+            # Set auto-clean settings
+            self.remove_special_chars_check.setChecked(settings.get("remove_special_chars", False))
+            self.replace_spaces_check.setChecked(settings.get("replace_spaces", False))
+            self.convert_case_check.setChecked(settings.get("convert_case", False))
+            self.remove_accents_check.setChecked(settings.get("remove_accents", False))
+        
+            # Set case type
+            self._set_combo_text(self.case_type_combo, settings.get("case_type", ""))
+        
+            # Set search term
+            self.search_input.setText(settings.get("search_term", ""))
+        
+            # Enable/disable case type combo based on convert_case setting
+            self.case_type_combo.setEnabled(self.convert_case_check.isChecked())
+        finally:
+            self.setUpdatesEnabled(True)
+            if was_wired:
+                self._reconnect_preview_signals()
+        if was_wired:
+            self.preview_callback()
     
     
     def clear_search(self):
@@ -1553,12 +1440,6 @@ class TopPanel(QWidget):
     
     def export_preview(self):
         """Export the current preview data to a file."""
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton, QFileDialog, QMessageBox
-        import csv
-        import json
-        import os
-        from datetime import datetime
-        
         # Get current preview data
         preview_data = self.get_current_preview_data()
         if not preview_data:
@@ -1605,32 +1486,20 @@ class TopPanel(QWidget):
         dialog.exec()
     
     def get_current_preview_data(self):
-        """Get the current preview data from the table."""
-        preview_data = []
-        for row in range(self.table.rowCount()):
-            old_name = self.table.item(row, 0).text() if self.table.item(row, 0) else ""
-            new_name = self.table.item(row, 1).text() if self.table.item(row, 1) else ""
-            # Prefer badge's status_text property if present
-            status_widget = self.table.cellWidget(row, 2)
-            if status_widget is not None and status_widget.property("status_text"):
-                status = status_widget.property("status_text")
-            else:
-                status = self.table.item(row, 2).text() if self.table.item(row, 2) else ""
-            preview_data.append({
-                "old_name": old_name,
-                "new_name": new_name,
-                "status": status
-            })
-        return preview_data
+        """Get the current preview data shown in the table.
+
+        The list is built once per preview and shared between callers; treat it as read-only.
+        """
+        if self._preview_data is None:
+            labels = self._status_labels
+            self._preview_data = [
+                {"old_name": old_name, "new_name": new_name, "status": labels[status]}
+                for old_name, new_name, status in zip(self._old_names, self._new_names, self._statuses)
+            ]
+        return self._preview_data
     
     def _perform_export(self, dialog, preview_data):
         """Perform the actual export operation."""
-        from PySide6.QtWidgets import QFileDialog, QMessageBox
-        import csv
-        import json
-        import os
-        from datetime import datetime
-        
         # Get selected format
         format_text = self.format_combo.currentText()
         if "CSV" in format_text:
@@ -1678,21 +1547,14 @@ class TopPanel(QWidget):
     
     def _export_csv(self, file_path, preview_data):
         """Export data to CSV format."""
-        import csv
-        
         with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['old_name', 'new_name', 'status']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            for row in preview_data:
-                writer.writerow(row)
+            writer = csv.writer(csvfile)
+            writer.writerow(('old_name', 'new_name', 'status'))
+            # Plain tuples in field order; DictWriter would re-map every row by key
+            writer.writerows((row['old_name'], row['new_name'], row['status']) for row in preview_data)
     
     def _export_json(self, file_path, preview_data):
         """Export data to JSON format."""
-        import json
-        from datetime import datetime
-        
         export_data = {
             "export_info": {
                 "timestamp": datetime.now().isoformat(),
@@ -1703,4 +1565,9 @@ class TopPanel(QWidget):
         }
         
         with open(file_path, 'w', encoding='utf-8') as jsonfile:
-            json.dump(export_data, jsonfile, indent=2, ensure_ascii=False)
+            if len(preview_data) <= self._JSON_PRETTY_MAX_ROWS:
+                json.dump(export_data, jsonfile, indent=2, ensure_ascii=False)
+            else:
+                # json.dump() and indented output both use the pure-Python encoder;
+                # a compact one-shot dumps() runs in the C encoder
+                jsonfile.write(json.dumps(export_data, ensure_ascii=False))
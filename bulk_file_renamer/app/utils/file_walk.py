@@ -0,0 +1,45 @@
+# Copyright (c) 2024 Dominic Ritzmann. All rights reserved.
+#
+# This software is licensed under the Bulk File Renamer License.
+# See LICENSE file for full license terms.
+#
+# You may use this software for personal and professional purposes, including
+# using it to organize and rename files as part of your business or selling
+# files that have been processed using this software.
+#
+# However, you may NOT modify, alter, or create derivative works of this software,
+# or sell, distribute, or license this software itself without explicit written
+# permission from the copyright holder.
+
+import os
+from typing import Iterator
+
+
+def iter_files(root: str) -> Iterator[str]:
+    """
+    Yield the path of every non-directory entry below root, in os.walk() order.
+
+    Uses os.scandir() with an explicit stack, so entries are classified from the
+    directory listing instead of a stat() per entry. Like os.walk(), symlinks to
+    directories are not descended into, and directories that can't be listed are
+    skipped. Being a generator, callers can stop the traversal early with break.
+    """
+    stack = [root]
+    while stack:
+        top = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(top) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        yield entry.path
+                    elif not entry.is_symlink():
+                        subdirs.append(entry.path)
+        except OSError:
+            continue
+        # Reversed so subdirectories are popped in listing order, as os.walk() visits them
+        stack.extend(reversed(subdirs))
@@ -12,9 +12,23 @@
 # permission from the copyright holder.
 
 import os
-from typing import List, Tuple, Optional
+from enum import IntEnum
+from typing import Dict, List, Tuple, Optional
 from datetime import datetime
-from .name_cleaner import clean_filename
+from .name_cleaner import clean_filename, clean_name_body
+
+
+class Status(IntEnum):
+    """Compact code for the status strings produced by generate_preview."""
+    READY = 0
+    CONFLICT = 1
+    NO_CHANGE = 2
+    EXT_LOCKED = 3
+
+
+# Raw (untranslated) status strings, indexed by Status
+STATUS_TEXT = ("Ready", "Conflict", "No Change", "Extension Locked")
+STATUS_FROM_TEXT = {text: Status(i) for i, text in enumerate(STATUS_TEXT)}
 
 def _detect_extension_change(old_name: str, new_name: str) -> bool:
     """Check if the file extension has changed between old and new names."""
@@ -22,6 +36,36 @@ def _detect_extension_change(old_name: str, new_name: str) -> bool:
     new_ext = os.path.splitext(new_name)[1].lower()
     return old_ext != new_ext and old_ext != "" and new_ext != ""
 
+# Directories holding at least this many of the requested files are listed once with
+# os.scandir() instead of stat()-ing each file; for a handful of files out of a large
+# directory the listing would cost more than it saves
+_SCANDIR_MIN_FILES = 16
+
+def _scan_entries(file_paths: List[str]) -> Dict[str, os.DirEntry]:
+    """Map requested paths to their DirEntry, listing each large directory group once.
+
+    DirEntry caches its stat() result (on Windows it comes with the listing itself).
+    Paths the listing doesn't match exactly, e.g. a different case on a case-insensitive
+    filesystem, are left out so the caller falls back to os.stat().
+    """
+    by_dir = {}
+    for fpath in file_paths:
+        by_dir.setdefault(os.path.dirname(fpath), []).append(fpath)
+    entries = {}
+    for dirname, paths in by_dir.items():
+        if len(paths) < _SCANDIR_MIN_FILES:
+            continue
+        wanted = {os.path.basename(p): p for p in paths}
+        try:
+            with os.scandir(dirname or os.curdir) as it:
+                for entry in it:
+                    fpath = wanted.get(entry.name)
+                    if fpath is not None:
+                        entries[fpath] = entry
+        except OSError:
+            continue
+    return entries
+
 def generate_preview(
     file_paths: List[str],
     prefix: str = "",
@@ -55,16 +99,30 @@ def generate_preview(
         # This will create conflicts, but we'll handle them in the preview
         pass
 
+    # Listing entries for large directory groups (None entries: stat individually)
+    entries = _scan_entries(file_paths)
+    need_stat = bool(size_filter or date_filter)
+    # str.endswith() accepts a tuple, so the suffixes are built once instead of per file
+    ext_suffixes = tuple(f".{ext}" for ext in extensions) if extensions else ()
     filtered_files = []
     for fpath in file_paths:
-        if not os.path.exists(fpath):
+        # Extension check is string-only, so it runs before touching the filesystem
+        if ext_suffixes and not os.path.basename(fpath).lower().endswith(ext_suffixes):
+            continue
+        entry = entries.get(fpath)
+        try:
+            if entry is None:
+                st = os.stat(fpath)
+            elif need_stat or entry.is_symlink():
+                # Cached on the entry; symlinks are resolved so broken ones are skipped
+                st = entry.stat()
+            else:
+                st = None  # Listed, so it exists
+        except (OSError, ValueError):
+            # Missing file (what os.path.exists() reported as False)
             continue
-        if extensions:
-            fname = os.path.basename(fpath).lower()
-            if not any(fname.endswith(f".{ext}") for ext in extensions):
-                continue
         if size_filter:
-            fsize = os.path.getsize(fpath)
+            fsize = st.st_size
             op, threshold = size_filter
             if (op == ">" and fsize <= threshold) or \
                (op == "<" and fsize >= threshold) or \
@@ -74,7 +132,7 @@ def generate_preview(
         if date_filter:
             op, threshold_date = date_filter
             # Use modification time as it's more reliable across platforms
-            file_time = datetime.fromtimestamp(os.path.getmtime(fpath))
+            file_time = datetime.fromtimestamp(st.st_mtime)
             if (op == "before" and file_time >= threshold_date) or \
                (op == "after" and file_time <= threshold_date):
                 continue
@@ -83,150 +141,129 @@ def generate_preview(
 
     preview_list = []
     # Track planned names case-insensitively to avoid conflicts on Windows/macOS
-    planned_names = {}
     planned_names_norm = {}
-    # Map each source path to its planned destination (normalized)
+    # Map each normalized source path to its planned destination (normalized); the
+    # first source wins when several normalize to the same path
     old_to_new_norm = {}
+    # (fpath, old_name, new_name, normalized new_name, new_path, normalized fpath,
+    # normalized new_path) per file, computed once here and reused by the status pass
+    records = []
 
     # Temporarily disable auto-resolve while the feature is in progress
     auto_resolve = False
+    apply_clean = remove_special_chars or replace_spaces or convert_case or remove_accents
+    clean_options = dict(
+        remove_special_chars=remove_special_chars,
+        replace_spaces=replace_spaces,
+        convert_case=convert_case,
+        case_type=case_type,
+        remove_accents=remove_accents
+    )
+    # Cleaned name bodies by raw body; with a base name and no numbering every file
+    # shares one body, so it is cleaned once instead of per file
+    cleaned_bodies = {}
+    numbered = start_num is not None
 
-    # First pass: build planned names dictionary
-    temp_count = start_num if start_num is not None else 1
+    # First pass: compute new names and build the planned names dictionary
+    count = start_num if numbered else 1
     for fpath in filtered_files:
         try:
-            old_name = os.path.basename(fpath)
+            dirname, old_name = os.path.split(fpath)
+            stem, ext = os.path.splitext(old_name)
             # Always use base name if provided, regardless of start number
             # This ensures the preview shows what the user expects
-            name_body = base_name if base_name else os.path.splitext(old_name)[0]
-            number_part = f"_{temp_count}" if start_num is not None else ""
+            name_body = base_name if base_name else stem
+            number_part = f"_{count}" if numbered else ""
             
-            # Handle extension locking
-            if extension_lock:
-                # Always preserve the original extension
-                ext = os.path.splitext(fpath)[1]
-                new_name = f"{prefix}{name_body}{number_part}{suffix}{ext}"
-            else:
-                # Allow extension changes (original behavior)
-                ext = os.path.splitext(fpath)[1]
-                new_name = f"{prefix}{name_body}{number_part}{suffix}{ext}"
+            # The original extension is kept with or without the extension lock; the
+            # lock only affects the status assigned below
+            new_body = f"{prefix}{name_body}{number_part}{suffix}"
 
             # Apply auto-clean transformations
-            if any([remove_special_chars, replace_spaces, convert_case, remove_accents]):
-                new_name = clean_filename(
-                    new_name,
-                    remove_special_chars=remove_special_chars,
-                    replace_spaces=replace_spaces,
-                    convert_case=convert_case,
-                    case_type=case_type,
-                    remove_accents=remove_accents
-                )
+            if not apply_clean:
+                new_name = new_body + ext
+            elif len(ext) > 1:
+                # splitext() already found the extension (its dot is the last one in the
+                # name), so only the part before it needs cleaning
+                cleaned = cleaned_bodies.get(new_body)
+                if cleaned is None:
+                    cleaned = cleaned_bodies[new_body] = clean_name_body(new_body, **clean_options)
+                new_name = cleaned + ext
+            else:
+                # Without an extension (or with a bare trailing dot) clean_filename()
+                # decides where one starts, e.g. at a dot in the suffix
+                new_name = clean_filename(new_body + ext, **clean_options)
 
             # Ensure new_name is valid
             if not new_name or new_name.strip() == "":
                 new_name = old_name  # Fallback to original name
 
-            # Safely add to planned names dictionaries
-            if new_name not in planned_names:
-                planned_names[new_name] = []
-            planned_names[new_name].append(fpath)
-            
             key_norm = os.path.normcase(new_name)
-            if key_norm not in planned_names_norm:
-                planned_names_norm[key_norm] = []
-            planned_names_norm[key_norm].append(fpath)
+            planned_names_norm.setdefault(key_norm, []).append(fpath)
             # Store planned destination path (normalized) for swap-chain detection
-            dest_norm = os.path.normcase(os.path.join(os.path.dirname(fpath), new_name))
-            old_to_new_norm[fpath] = dest_norm
-            if start_num is not None:
-                temp_count += 1
+            new_path = os.path.join(dirname, new_name)
+            src_norm = os.path.normcase(fpath)
+            dest_norm = os.path.normcase(new_path)
+            old_to_new_norm.setdefault(src_norm, dest_norm)
+            records.append((fpath, old_name, new_name, key_norm, new_path, src_norm, dest_norm))
+            if numbered:
+                count += 1
         except Exception:
             # Skip problematic files to prevent crashes
             continue
 
-    # Second pass: create preview list with proper numbering
-    count = start_num if start_num is not None else 1
-    for fpath in filtered_files:
-        try:
-            old_name = os.path.basename(fpath)
-            # Always use base name if provided, regardless of start number
-            # This ensures the preview shows what the user expects
-            name_body = base_name if base_name else os.path.splitext(old_name)[0]
-            number_part = f"_{count}" if start_num is not None else ""
-        
-            # Handle extension locking (same logic as above)
-            if extension_lock:
-                # Always preserve the original extension
-                ext = os.path.splitext(fpath)[1]
-                new_name = f"{prefix}{name_body}{number_part}{suffix}{ext}"
-            else:
-                # Allow extension changes (original behavior)
-                ext = os.path.splitext(fpath)[1]
-                new_name = f"{prefix}{name_body}{number_part}{suffix}{ext}"
+    # Second pass: assign statuses now that all planned names are known
+    # Resolved source paths per duplicated planned name, shared by every file in the group
+    resolved_sources = {}
+    # realpath() per source path; a file is resolved for its group and again as itself
+    realpath_cache = {}
 
-            # Apply auto-clean transformations (same as in first loop)
-            if any([remove_special_chars, replace_spaces, convert_case, remove_accents]):
-                new_name = clean_filename(
-                    new_name,
-                    remove_special_chars=remove_special_chars,
-                    replace_spaces=replace_spaces,
-                    convert_case=convert_case,
-                    case_type=case_type,
-                    remove_accents=remove_accents
-                )
-            
-            # Ensure new_name is valid
-            if not new_name or new_name.strip() == "":
-                new_name = old_name  # Fallback to original name
-                
-            new_path = os.path.join(os.path.dirname(fpath), new_name)
+    def cached_realpath(path: str) -> str:
+        resolved = realpath_cache.get(path)
+        if resolved is None:
+            resolved = realpath_cache[path] = os.path.realpath(path)
+        return resolved
 
+    for fpath, old_name, new_name, new_norm, new_path, src_norm, dest_norm in records:
+        try:
             # Treat case-only changes as valid (especially on case-insensitive filesystems)
-            if os.path.normcase(old_name) == os.path.normcase(new_name) and old_name != new_name:
+            if os.path.normcase(old_name) == new_norm and old_name != new_name:
                 status = "Ready"
             elif old_name == new_name:
                 status = "No Change"
             elif extension_lock and _detect_extension_change(old_name, new_name):
                 status = "Extension Locked"
-            elif os.path.normcase(new_name) in planned_names_norm and len(planned_names_norm[os.path.normcase(new_name)]) > 1:
+            elif len(planned_names_norm[new_norm]) > 1:
                 # If duplicates exist, ensure they are not just this same file reported multiple times
-                entries = planned_names_norm[os.path.normcase(new_name)]
-                unique_sources = set()
-                for p in entries:
-                    try:
-                        unique_sources.add(os.path.realpath(p))
-                    except Exception:
-                        unique_sources.add(p)
-                if len(unique_sources) == 1 and os.path.realpath(fpath) in unique_sources:
+                unique_sources = resolved_sources.get(new_norm)
+                if unique_sources is None:
+                    unique_sources = set()
+                    for p in planned_names_norm[new_norm]:
+                        try:
+                            unique_sources.add(cached_realpath(p))
+                        except Exception:
+                            unique_sources.add(p)
+                    resolved_sources[new_norm] = unique_sources
+                if len(unique_sources) == 1 and cached_realpath(fpath) in unique_sources:
                     status = "Ready"
                 else:
                     status = "Conflict"
-            elif os.path.exists(new_path) and os.path.normcase(new_path) != os.path.normcase(fpath):
+            elif os.path.exists(new_path) and dest_norm != src_norm:
                 # If only case differs and file exists (Windows), allow as Ready
                 try:
                     if os.path.samefile(new_path, fpath):
                         status = "Ready"
                     else:
                         # If the path is currently occupied by another source file that will be renamed away
-                        norm_target = os.path.normcase(new_path)
-                        occupied_planned = None
-                        for src, planned_norm in old_to_new_norm.items():
-                            if os.path.normcase(src) == norm_target:
-                                occupied_planned = planned_norm
-                                break
-                        if occupied_planned is not None and occupied_planned != norm_target:
+                        occupied_planned = old_to_new_norm.get(dest_norm)
+                        if occupied_planned is not None and occupied_planned != dest_norm:
                             status = "Ready"  # swap-chain, safe
                         else:
                             status = "Conflict"
                 except Exception:
                     # Fallback: treat as potential swap-chain before marking conflict
-                    norm_target = os.path.normcase(new_path)
-                    occupied_planned = None
-                    for src, planned_norm in old_to_new_norm.items():
-                        if os.path.normcase(src) == norm_target:
-                            occupied_planned = planned_norm
-                            break
-                    if occupied_planned is not None and occupied_planned != norm_target:
+                    occupied_planned = old_to_new_norm.get(dest_norm)
+                    if occupied_planned is not None and occupied_planned != dest_norm:
                         status = "Ready"
                     else:
                         status = "Conflict"
@@ -248,8 +285,6 @@ def generate_preview(
                     counter += 1
             else:
                 preview_list.append((old_name, new_name, status, fpath))
-            if start_num is not None:
-                count += 1
         except Exception:
             # Skip problematic files to prevent crashes
             continue
@@ -0,0 +1,45 @@
+# Copyright (c) 2024 Dominic Ritzmann. All rights reserved.
+#
+# This software is licensed under the Bulk File Renamer License.
+# See LICENSE file for full license terms.
+#
+# You may use this software for personal and professional purposes, including
+# using it to organize and rename files as part of your business or selling
+# files that have been processed using this software.
+#
+# However, you may NOT modify, alter, or create derivative works of this software,
+# or sell, distribute, or license this software itself without explicit written
+# permission from the copyright holder.
+
+"""
+Small JSON file helpers.
+Uses orjson when it is installed and falls back to the standard json module otherwise;
+both write UTF-8 with two-space indentation.
+"""
+
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+
+def load_json(path: str) -> Any:
+    """Read and decode a UTF-8 JSON file."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def dump_json(data: Any, path: str) -> None:
+    """Encode data as indented UTF-8 JSON and write it to path."""
+    if orjson is not None:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        encoded = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(encoded)
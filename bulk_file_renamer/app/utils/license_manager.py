@@ -19,15 +19,18 @@ Handles hardware fingerprinting and license validation
 import os
 import platform
 import hashlib
-import json
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Tuple
+from .json_io import dump_json, load_json
 
 
+@lru_cache(maxsize=None)
 def get_machine_fingerprint() -> str:
     """
     Generate unique hardware fingerprint for the current machine.
     This creates a unique identifier based on hardware characteristics.
+    The hardware doesn't change while the app runs, so it is computed once per process.
     """
     try:
         # Get hardware identifiers
@@ -45,8 +48,15 @@ def get_machine_fingerprint() -> str:
             mac_address = "unknown"
         
         # Create unique fingerprint
-        fingerprint_data = f"{cpu_id}:{machine}:{system}:{node}:{mac_address}"
-        return hashlib.md5(fingerprint_data.encode()).hexdigest()[:12]
+        fingerprint_data = f"{cpu_id}:{machine}:{system}:{node}:{mac_address}".encode()
+        # MD5 only condenses the identifiers; keeping it keeps existing machine IDs (and
+        # the license keys issued for them) valid. Marking it as non-security use lets it
+        # run on FIPS-restricted Python builds (the flag needs Python 3.9+)
+        try:
+            digest = hashlib.md5(fingerprint_data, usedforsecurity=False)
+        except TypeError:
+            digest = hashlib.md5(fingerprint_data)
+        return digest.hexdigest()[:12]
     except Exception:
         # Fallback if any component fails
         return "unknown"
@@ -77,14 +87,26 @@ class LicenseManager:
         self.license_file = os.path.join(os.path.expanduser("~"), f".{app_name}_license.dat")
         self.machine_id = get_machine_fingerprint()
         self.embedded_license_file = os.path.join(os.path.dirname(__file__), "..", "..", "license.dat")
+        # Result of the last is_licensed() check; reset when the license is (de)activated
+        self._licensed_cache: Optional[bool] = None
     
     def is_licensed(self) -> bool:
         """
         Check if the application is properly licensed for this machine.
         First checks embedded license, then user license, then auto-activates universal license.
+        The result is cached until activate_license() or deactivate_license() is called.
         """
+        if self._licensed_cache is None:
+            self._licensed_cache = self._compute_is_licensed()
+        return self._licensed_cache
+
+    def _compute_is_licensed(self) -> bool:
+        """Run the license checks without the cache."""
+        # The embedded file backs both the pre-activated and the universal check; read it once
+        embedded_data = self._read_license_file(self.embedded_license_file)
+
         # Check embedded license first (for pre-activated installations)
-        if self._check_embedded_license():
+        if self._check_embedded_license(embedded_data):
             return True
         
         # Check user license (for manual activation)
@@ -92,20 +114,27 @@ class LicenseManager:
             return True
         
         # Check for universal license and auto-activate
-        if self._check_and_activate_universal_license():
+        if self._check_and_activate_universal_license(embedded_data):
             return True
         
         return False
+
+    @staticmethod
+    def _read_license_file(path: str) -> Optional[dict]:
+        """Load a license file, or None if it is missing or unreadable."""
+        if not os.path.exists(path):
+            return None
+        try:
+            return load_json(path)
+        except Exception:
+            return None
     
-    def _check_embedded_license(self) -> bool:
-        """Check if there's a valid embedded license file."""
-        if not os.path.exists(self.embedded_license_file):
+    def _check_embedded_license(self, license_data: Optional[dict]) -> bool:
+        """Check if the embedded license data is valid for this machine."""
+        if license_data is None:
             return False
         
         try:
-            with open(self.embedded_license_file, 'r', encoding='utf-8') as f:
-                license_data = json.load(f)
-            
             # Validate machine ID
             if license_data.get("machine_id") != self.machine_id:
                 return False
@@ -125,13 +154,11 @@ class LicenseManager:
     
     def _check_user_license(self) -> bool:
         """Check if there's a valid user license file."""
-        if not os.path.exists(self.license_file):
+        license_data = self._read_license_file(self.license_file)
+        if license_data is None:
             return False
         
         try:
-            with open(self.license_file, 'r', encoding='utf-8') as f:
-                license_data = json.load(f)
-            
             # Validate machine ID
             if license_data.get("machine_id") != self.machine_id:
                 return False
@@ -149,20 +176,16 @@ class LicenseManager:
     def _copy_embedded_to_user_license(self, license_data: dict):
         """Copy embedded license to user directory."""
         try:
-            with open(self.license_file, 'w', encoding='utf-8') as f:
-                json.dump(license_data, f, indent=2)
+            dump_json(license_data, self.license_file)
         except Exception:
             pass  # Ignore errors when copying
     
-    def _check_and_activate_universal_license(self) -> bool:
-        """Check for universal license and auto-activate it."""
-        if not os.path.exists(self.embedded_license_file):
+    def _check_and_activate_universal_license(self, license_data: Optional[dict]) -> bool:
+        """Check the embedded license data for a universal license and auto-activate it."""
+        if license_data is None:
             return False
         
         try:
-            with open(self.embedded_license_file, 'r', encoding='utf-8') as f:
-                license_data = json.load(f)
-            
             # Check if it's a universal license
             if license_data.get("license_type") != "universal":
                 return False
@@ -180,8 +203,7 @@ class LicenseManager:
             }
             
             # Save the activated license
-            with open(self.license_file, 'w', encoding='utf-8') as f:
-                json.dump(activated_license, f, indent=2)
+            dump_json(activated_license, self.license_file)
             
             return True
             
@@ -213,13 +235,14 @@ class LicenseManager:
                 "app_version": "1.0.0"
             }
             
-            with open(self.license_file, 'w', encoding='utf-8') as f:
-                json.dump(license_data, f, indent=2)
+            dump_json(license_data, self.license_file)
             
             return True, "License activated successfully!"
             
         except Exception as e:
             return False, f"Failed to save license: {str(e)}"
+        finally:
+            self._licensed_cache = None
     
     def get_machine_id(self) -> str:
         """Get the current machine ID for license generation."""
@@ -236,16 +259,11 @@ class LicenseManager:
             return True
         except Exception:
             return False
+        finally:
+            self._licensed_cache = None
     
     def get_license_info(self) -> Optional[dict]:
         """
         Get current license information.
         """
-        if not os.path.exists(self.license_file):
-            return None
-        
-        try:
-            with open(self.license_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception:
-            return None
\ No newline at end of file
+        return self._read_license_file(self.license_file)
\ No newline at end of file
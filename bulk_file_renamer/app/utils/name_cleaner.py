@@ -16,6 +16,26 @@ import re
 import unicodedata
 from typing import Optional
 
+# Compiled once at import; clean_filename runs for every file in the preview
+_SPECIAL_CHARS = re.compile(r'[^\w\s\-\.]+')
+_MULTI_UNDERSCORES = re.compile(r'_+')
+_MULTI_DOTS = re.compile(r'\.+')
+
+
+class _CombiningMarkTable(dict):
+    """str.translate table that deletes nonspacing marks (category Mn).
+
+    Codepoints are classified on first lookup and cached, so the table only
+    grows with the characters actually seen instead of covering all of Unicode.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        value = None if unicodedata.category(chr(codepoint)) == 'Mn' else codepoint
+        self[codepoint] = value
+        return value
+
+
+_STRIP_COMBINING_MARKS = _CombiningMarkTable()
 
 def clean_filename(filename: str, 
                   remove_special_chars: bool = False,
@@ -43,23 +63,51 @@ def clean_filename(filename: str,
     # Split filename and extension
     name, ext = filename.rsplit('.', 1) if '.' in filename else (filename, '')
     
+    name = clean_name_body(
+        name,
+        remove_special_chars=remove_special_chars,
+        replace_spaces=replace_spaces,
+        convert_case=convert_case,
+        case_type=case_type,
+        remove_accents=remove_accents
+    )
+    
+    # Reconstruct filename
+    if ext:
+        return f"{name}.{ext}"
+    else:
+        return name
+
+
+def clean_name_body(name: str,
+                    remove_special_chars: bool = False,
+                    replace_spaces: bool = False,
+                    convert_case: bool = False,
+                    case_type: str = "lowercase",
+                    remove_accents: bool = False) -> str:
+    """
+    Clean the part of a filename before its extension.
+    
+    Callers that already split the extension off use this directly; the
+    extension itself is never changed by cleaning.
+    """
     # Remove accents first (before other operations)
     if remove_accents:
         name = unicodedata.normalize('NFD', name)
-        name = ''.join(char for char in name if unicodedata.category(char) != 'Mn')
+        if not name.isascii():
+            name = name.translate(_STRIP_COMBINING_MARKS)
     
     # Remove special characters
     if remove_special_chars:
-        # Keep alphanumeric, spaces, hyphens, underscores, and dots
-        name = re.sub(r'[^\w\s\-\.]', '', name)
-        # Remove multiple consecutive special characters
-        name = re.sub(r'[^\w\s\-\.]+', '', name)
+        # Keep alphanumeric, spaces, hyphens, underscores, and dots; runs of other
+        # characters are removed in one match
+        name = _SPECIAL_CHARS.sub('', name)
     
     # Replace spaces with underscores
     if replace_spaces:
         name = name.replace(' ', '_')
         # Remove multiple consecutive underscores
-        name = re.sub(r'_+', '_', name)
+        name = _MULTI_UNDERSCORES.sub('_', name)
         # Remove leading/trailing underscores
         name = name.strip('_')
     
@@ -74,15 +122,11 @@ def clean_filename(filename: str,
     
     # Clean up any remaining issues
     # Remove multiple consecutive dots
-    name = re.sub(r'\.+', '.', name)
+    name = _MULTI_DOTS.sub('.', name)
     # Remove leading/trailing dots and spaces
     name = name.strip('. ')
     
-    # Reconstruct filename
-    if ext:
-        return f"{name}.{ext}"
-    else:
-        return name
+    return name
 
 
 def get_cleanup_preview(original_name: str, 
@@ -11,10 +11,10 @@
 # or sell, distribute, or license this software itself without explicit written
 # permission from the copyright holder.
 
-import json
 import os
 from typing import Dict, List, Optional
 from datetime import datetime
+from .json_io import dump_json, load_json
 
 
 class ProfileManager:
@@ -54,8 +54,7 @@ class ProfileManager:
                 "version": "1.0"
             }
             
-            with open(profile_path, 'w', encoding='utf-8') as f:
-                json.dump(profile_data, f, indent=2, ensure_ascii=False)
+            dump_json(profile_data, profile_path)
             
             return True
         except Exception as e:
@@ -70,8 +69,7 @@ class ProfileManager:
             if not os.path.exists(profile_path):
                 return None
             
-            with open(profile_path, 'r', encoding='utf-8') as f:
-                profile_data = json.load(f)
+            profile_data = load_json(profile_path)
             
             return profile_data
         except Exception as e:
@@ -84,11 +82,10 @@ class ProfileManager:
             if not os.path.exists(self.profiles_dir):
                 return []
             
-            profiles = []
-            for filename in os.listdir(self.profiles_dir):
-                if filename.endswith('.json'):
-                    profile_name = filename[:-5]  # Remove .json extension
-                    profiles.append(profile_name)
+            with os.scandir(self.profiles_dir) as it:
+                # is_file() is answered from the listing on most platforms, no extra stat
+                profiles = [entry.name[:-5]  # Remove .json extension
+                            for entry in it if entry.name.endswith('.json') and entry.is_file()]
             
             return sorted(profiles)
         except Exception as e:
@@ -13,14 +13,24 @@
 
 import json
 import os
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, Optional
 from datetime import datetime
+from .json_io import dump_json, load_json
 
 
 class SettingsManager:
     """Manages application settings with persistence."""
     
-    def __init__(self, settings_file: str = None):
+    def __init__(self, settings_file: str = None, autosave_delay: Optional[float] = None):
+        # Seconds after the last change before the settings are saved in the background;
+        # None leaves saving to explicit save_settings() calls
+        self.autosave_delay = autosave_delay
+        self._save_timer: Optional[threading.Timer] = None
+        # Guards the settings between the GUI thread and the autosave timer thread
+        self._lock = threading.RLock()
+        # Serialized settings as last loaded or saved; saving identical settings is skipped
+        self._saved_content: Optional[str] = None
         if settings_file is None:
             # Use user's AppData directory for settings
             import sys
@@ -99,8 +109,8 @@ class SettingsManager:
         """Load settings from file or return defaults."""
         try:
             if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    loaded_settings = json.load(f)
+                loaded_settings = load_json(self.settings_file)
+                self._saved_content = self._content_key(loaded_settings)
                 
                 # Merge with defaults to handle new settings
                 settings = self.default_settings.copy()
@@ -116,23 +126,54 @@ class SettingsManager:
             print(f"Error loading settings: {e}")
             return self.default_settings.copy()
     
+    @staticmethod
+    def _content_key(settings: Dict[str, Any]) -> str:
+        """Serialize settings without metadata, for comparing against the saved file."""
+        return json.dumps({k: v for k, v in settings.items() if k != "_metadata"}, sort_keys=True)
+    
     def save_settings(self) -> bool:
-        """Save current settings to file."""
-        try:
-            # Create a copy without metadata for saving
-            settings_to_save = {k: v for k, v in self.settings.items() if k != "_metadata"}
-            settings_to_save["_metadata"] = {
-                "version": "1.0",
-                "last_updated": datetime.now().isoformat()
-            }
-            
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings_to_save, f, indent=2, ensure_ascii=False)
-            
-            return True
-        except Exception as e:
-            print(f"Error saving settings: {e}")
-            return False
+        """Save current settings to file, unless they match what was last loaded or saved."""
+        with self._lock:
+            self._cancel_autosave()
+            try:
+                content_key = self._content_key(self.settings)
+                if content_key == self._saved_content:
+                    return True
+                
+                # Create a copy without metadata for saving
+                settings_to_save = {k: v for k, v in self.settings.items() if k != "_metadata"}
+                settings_to_save["_metadata"] = {
+                    "version": "1.0",
+                    "last_updated": datetime.now().isoformat()
+                }
+                
+                # Write a temporary file and swap it in, so an interrupted save can't
+                # leave a truncated settings file behind
+                temp_file = self.settings_file + ".tmp"
+                dump_json(settings_to_save, temp_file)
+                os.replace(temp_file, self.settings_file)
+                
+                self._saved_content = content_key
+                return True
+            except Exception as e:
+                print(f"Error saving settings: {e}")
+                return False
+    
+    def _schedule_autosave(self):
+        """Restart the autosave countdown, so a burst of changes is written once."""
+        if self.autosave_delay is None:
+            return
+        with self._lock:
+            self._cancel_autosave()
+            self._save_timer = threading.Timer(self.autosave_delay, self.save_settings)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def _cancel_autosave(self):
+        """Stop a pending autosave, if any."""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
     
     def get(self, key: str, default=None):
         """Get a setting value."""
@@ -140,30 +181,31 @@ class SettingsManager:
     
     def set(self, key: str, value: Any):
         """Set a setting value."""
-        self.settings[key] = value
+        with self._lock:
+            self.settings[key] = value
+        self._schedule_autosave()
     
     def reset_to_defaults(self):
         """Reset all settings to defaults."""
-        self.settings = self.default_settings.copy()
+        with self._lock:
+            self.settings = self.default_settings.copy()
+        self._schedule_autosave()
+    
+    def _push_recent(self, key: str, item: str):
+        """Move item to the front of the recent list stored under key, keeping max_recent_items."""
+        with self._lock:
+            # One pass builds the new list: no remove() scan followed by an insert(0) shift
+            recent = [item] + [entry for entry in self.settings.get(key, []) if entry != item]
+            
+            # Limit to max_recent_items
+            max_items = self.settings.get("max_recent_items", 10)
+            self.settings[key] = recent[:max_items]
+        self._schedule_autosave()
     
     def add_recent_folder(self, folder_path: str):
         """Add a folder to recent folders list."""
-        recent = self.settings.get("recent_folders", [])
-        if folder_path in recent:
-            recent.remove(folder_path)
-        recent.insert(0, folder_path)
-        
-        # Limit to max_recent_items
-        max_items = self.settings.get("max_recent_items", 10)
-        self.settings["recent_folders"] = recent[:max_items]
+        self._push_recent("recent_folders", folder_path)
     
     def add_recent_profile(self, profile_name: str):
         """Add a profile to recent profiles list."""
-        recent = self.settings.get("recent_profiles", [])
-        if profile_name in recent:
-            recent.remove(profile_name)
-        recent.insert(0, profile_name)
-        
-        # Limit to max_recent_items
-        max_items = self.settings.get("max_recent_items", 10)
-        self.settings["recent_profiles"] = recent[:max_items]
+        self._push_recent("recent_profiles", profile_name)
@@ -13,10 +13,30 @@
 
 import os
 import sys
-import json
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Iterable, Optional, Tuple
+from .json_io import load_json
 
+# Marks a key that is absent from a language (a present key may map to None)
+_MISSING = object()
 
+
+def _flatten(data: Dict[str, Any], prefix: str = "") -> Iterable[Tuple[str, Any]]:
+    """Yield (dotted path, value) for every entry of a nested translation dictionary.
+
+    Sections are yielded as well as leaf strings. Names that contain a dot can't be
+    addressed with dot notation, so they are left out.
+    """
+    for name, value in data.items():
+        if '.' in name:
+            continue
+        path = prefix + name
+        yield path, value
+        if isinstance(value, dict):
+            yield from _flatten(value, path + '.')
+
+
+@lru_cache(maxsize=8)
 def _resolve_languages_dir(default_dir: str = "languages") -> str:
     """Resolve the absolute path to the languages directory in both dev and packaged builds.
 
@@ -26,6 +46,7 @@ def _resolve_languages_dir(default_dir: str = "languages") -> str:
     3) Directory of this file (source checkout)/../../languages
     4) Current working directory /languages
     If none exist, return the provided default_dir (absolute from CWD) so the app can still run.
+    The result is cached per default_dir, since the candidate locations don't move while the app runs.
     """
     candidates = []
 
@@ -63,49 +84,71 @@ class TranslationManager:
         self.languages_dir = _resolve_languages_dir(languages_dir)
         self.current_language = "en"  # Default to English
         self.translations: Dict[str, Dict[str, Any]] = {}
+        # Each language flattened to {dotted key: value}, built once at load time
+        self._flat_translations: Dict[str, Dict[str, Any]] = {}
+        # Resolved values for the current language by key; cleared when the language changes
+        self._lookup_cache: Dict[str, Any] = {}
         self.available_languages = self._discover_languages()
-        self._load_translations()
     
     def _discover_languages(self) -> Dict[str, str]:
-        """Discover available language files."""
+        """
+        Discover available language files.
+        
+        Only English (always needed as the fallback) is parsed here. Its
+        'settings.advanced.languages' section names every shipped language the
+        way that language names itself, so the other files are parsed on first
+        use; a file English doesn't name is parsed now to read its own name.
+        """
         languages = {}
         if not os.path.exists(self.languages_dir):
             return languages
         
-        for filename in os.listdir(self.languages_dir):
-            if filename.endswith('.json'):
-                lang_code = filename[:-5]  # Remove .json extension
-                # Try to get language name from the translation file
-                try:
-                    with open(os.path.join(self.languages_dir, filename), 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        lang_name = data.get('settings', {}).get('advanced', {}).get('languages', {}).get(lang_code, lang_code.upper())
-                        languages[lang_code] = lang_name
-                except Exception:
-                    languages[lang_code] = lang_code.upper()
+        lang_codes = [filename[:-5]  # Remove .json extension
+                      for filename in os.listdir(self.languages_dir) if filename.endswith('.json')]
+        known_names = self._language_names(self._load_language("en")) if "en" in lang_codes else {}
+        for lang_code in lang_codes:
+            lang_name = known_names.get(lang_code)
+            if not isinstance(lang_name, str):
+                lang_name = self._language_names(self._load_language(lang_code)).get(lang_code)
+            languages[lang_code] = lang_name if lang_name is not None else lang_code.upper()
         
         return languages
     
-    def _load_translations(self):
-        """Load all available translations."""
-        for lang_code in self.available_languages:
+    @staticmethod
+    def _language_names(data: Any) -> Dict[str, Any]:
+        """Return the {code: name} map of a parsed language file, or {} if it has none."""
+        try:
+            names = data.get('settings', {}).get('advanced', {}).get('languages', {})
+        except Exception:
+            return {}
+        return names if isinstance(names, dict) else {}
+    
+    def _ensure_loaded(self, lang_code: str):
+        """Parse a language file the first time it is needed."""
+        if lang_code not in self.translations and lang_code in self.available_languages:
             self._load_language(lang_code)
     
-    def _load_language(self, lang_code: str):
-        """Load translations for a specific language."""
+    def _load_language(self, lang_code: str) -> Any:
+        """Load translations for a specific language and return the parsed data."""
         lang_file = os.path.join(self.languages_dir, f"{lang_code}.json")
         if os.path.exists(lang_file):
             try:
-                with open(lang_file, 'r', encoding='utf-8') as f:
-                    self.translations[lang_code] = json.load(f)
+                self.translations[lang_code] = load_json(lang_file)
             except Exception as e:
                 print(f"Error loading language file {lang_file}: {e}")
                 self.translations[lang_code] = {}
+            data = self.translations[lang_code]
+            self._flat_translations[lang_code] = dict(_flatten(data)) if isinstance(data, dict) else {}
+            self._lookup_cache.clear()
+        return self.translations.get(lang_code, {})
     
     def set_language(self, lang_code: str) -> bool:
         """Set the current language."""
         if lang_code in self.available_languages:
-            self.current_language = lang_code
+            if lang_code != self.current_language:
+                self._ensure_loaded(lang_code)
+                self.current_language = lang_code
+                self._lookup_cache.clear()
             return True
         return False
     
@@ -129,24 +172,9 @@ class TranslationManager:
             Translated string or the key if translation not found
         """
         try:
-            # Navigate through nested dictionary using dot notation
-            keys = key.split('.')
-            value = self.translations.get(self.current_language, {})
-            
-            for k in keys:
-                if isinstance(value, dict) and k in value:
-                    value = value[k]
-                else:
-                    # Fallback to English if current language doesn't have the key
-                    if self.current_language != "en":
-                        value = self.translations.get("en", {})
-                        for k in keys:
-                            if isinstance(value, dict) and k in value:
-                                value = value[k]
-                            else:
-                                return key  # Return key if not found in English either
-                    else:
-                        return key  # Return key if not found
+            value = self._lookup(key)
+            if value is None:
+                return key
             
             # Format the string if kwargs are provided
             if kwargs and isinstance(value, str):
@@ -155,16 +183,76 @@ class TranslationManager:
                 except (KeyError, ValueError):
                     return value
             
-            return str(value) if value is not None else key
+            return str(value)
             
         except Exception as e:
             print(f"Translation error for key '{key}': {e}")
             return key
     
+    def _lookup(self, key: str) -> Any:
+        """
+        Resolve a dotted key for the current language, falling back to English.
+        
+        Results (None when the key is missing) are cached per key, so repeated
+        tr() calls for the same label skip the English fallback as well.
+        """
+        try:
+            return self._lookup_cache[key]
+        except KeyError:
+            pass
+        value = self._flat_translations.get(self.current_language, {}).get(key, _MISSING)
+        if value is _MISSING and self.current_language != "en":
+            # Fallback to English if current language doesn't have the key
+            value = self._flat_translations.get("en", {}).get(key, _MISSING)
+        if value is _MISSING:
+            value = None
+        self._lookup_cache[key] = value
+        return value
+    
     def tr(self, key: str, **kwargs) -> str:
         """Short alias for translate method."""
         return self.translate(key, **kwargs)
     
+    def _section(self, lang_code: str, path: str) -> Optional[Dict[str, Any]]:
+        """Return the nested dictionary at dotted ``path`` for a language, or None."""
+        self._ensure_loaded(lang_code)
+        value = self.translations.get(lang_code, {})
+        if path:
+            for k in path.split('.'):
+                if not isinstance(value, dict) or k not in value:
+                    return None
+                value = value[k]
+        return value if isinstance(value, dict) else None
+    
+    def tr_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """
+        Translate several keys in one pass.
+        
+        Keys sharing a parent section (e.g. 'top_panel.naming.*') resolve that
+        section once. Missing keys fall back to English and then to the key
+        itself, like translate().
+        
+        Returns:
+            Dictionary mapping each key to its translated string
+        """
+        result: Dict[str, str] = {}
+        sections: Dict[str, tuple] = {}
+        for key in keys:
+            parent, _, leaf = key.rpartition('.')
+            pair = sections.get(parent)
+            if pair is None:
+                en = self._section("en", parent) if self.current_language != "en" else None
+                pair = sections[parent] = (self._section(self.current_language, parent), en)
+            current, fallback = pair
+            if current is not None and leaf in current:
+                value = current[leaf]
+            elif fallback is not None and leaf in fallback:
+                value = fallback[leaf]
+            else:
+                value = None
+            result[key] = str(value) if value is not None else key
+        return result
+    
     def get_menu_text(self, menu_key: str) -> str:
         """Get menu text with proper ampersand handling."""
         text = self.tr(f"app.menu.{menu_key}")
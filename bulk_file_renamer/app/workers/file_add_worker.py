@@ -13,16 +13,31 @@
 
 import os
 from PySide6.QtCore import QThread, Signal
+from app.utils.file_walk import iter_files
+
+# Newly added paths are handed to the GUI thread in batches of this size while the walk runs
+_CHUNK_SIZE = 1000
 
 class FileAddWorker(QThread):
     progress = Signal(int)  # emits progress percentage
-    finished = Signal(list, int)  # emits list of newly added file paths and duplicate count
+    chunk = Signal(list)  # emits a full batch of newly added file paths during the run
+    finished = Signal(list, int)  # emits the added paths not yet sent through chunk, and duplicate count
 
     def __init__(self, paths, existing_files=None):
         super().__init__()
         self.paths = paths
-        # Normalize existing files for consistent comparison
-        self.existing_files = set(os.path.normpath(f) for f in (existing_files or []))
+        # Comparison keys of the files already in the list: normalized, and case-folded
+        # where the platform ignores case (os.path.normcase is a no-op on POSIX)
+        self.existing_files = set(os.path.normcase(os.path.normpath(f)) for f in (existing_files or []))
+        # Last emitted percentage; each change crosses to the GUI thread as a queued event
+        self._last_progress = -1
+
+    def _report_progress(self, done, total):
+        """Emit progress only when the whole percentage changes."""
+        percent = done * 100 // total
+        if percent != self._last_progress:
+            self._last_progress = percent
+            self.progress.emit(percent)
 
     def run(self):
         added_files = []
@@ -33,26 +48,33 @@ class FileAddWorker(QThread):
             if os.path.isfile(path):
                 # Normalize path for consistent comparison
                 normalized_path = os.path.normpath(path)
-                if normalized_path not in self.existing_files:
+                key = os.path.normcase(normalized_path)
+                if key not in self.existing_files:
                     added_files.append(normalized_path)
-                    self.existing_files.add(normalized_path)
+                    self.existing_files.add(key)
                 else:
                     duplicate_count += 1
             elif os.path.isdir(path):
-                for root, _, files in os.walk(path):
-                    for f in files:
-                        full_path = os.path.join(root, f)
-                        # Normalize path for consistent comparison
-                        normalized_path = os.path.normpath(full_path)
-                        if normalized_path not in self.existing_files:
-                            added_files.append(normalized_path)
-                            self.existing_files.add(normalized_path)
-                        else:
-                            duplicate_count += 1
+                # Joining plain entry names onto a normalized absolute root already gives
+                # normalized paths, so only the root needs normpath(); relative roots such
+                # as "." would still gain a "./" prefix and are normalized per file
+                root = os.path.normpath(path)
+                normalize_each = not os.path.isabs(root)
+                for full_path in iter_files(root):
+                    normalized_path = os.path.normpath(full_path) if normalize_each else full_path
+                    # The emitted path keeps its casing; only the key is case-folded
+                    key = os.path.normcase(normalized_path)
+                    if key not in self.existing_files:
+                        added_files.append(normalized_path)
+                        self.existing_files.add(key)
+                        if len(added_files) >= _CHUNK_SIZE:
+                            self.chunk.emit(added_files)
+                            added_files = []
+                    else:
+                        duplicate_count += 1
             
             # Emit progress
-            progress_percent = int((idx / total_paths) * 100)
-            self.progress.emit(progress_percent)
+            self._report_progress(idx, total_paths)
 
-        # ✅ Emit *all files at once* (no per-file updates) and duplicate count
+        # ✅ Emit the remaining files (all of them for small adds) and duplicate count
         self.finished.emit(added_files, duplicate_count)
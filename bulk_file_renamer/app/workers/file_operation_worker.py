@@ -22,6 +22,15 @@ class FileOperationWorker(QThread):
     def __init__(self, file_ops):
         super().__init__()
         self.file_ops = file_ops
+        # Last emitted percentage; each change crosses to the GUI thread as a queued event
+        self._last_progress = -1
+
+    def _report_progress(self, done, total):
+        """Emit progress only when the whole percentage changes."""
+        percent = done * 100 // total
+        if percent != self._last_progress:
+            self._last_progress = percent
+            self.progress.emit(percent)
 
     def run(self):
         successes, errors, conflicts = [], [], []
@@ -30,19 +39,19 @@ class FileOperationWorker(QThread):
         for idx, op in enumerate(self.file_ops, start=1):
             old_path, new_path = op["old_path"], op["new_path"]
             try:
-                # Check if it's a case-only change on case-insensitive filesystem
-                is_case_only_change = (os.path.normcase(old_path) == os.path.normcase(new_path) and 
-                                     old_path != new_path)
+                # Only check for conflicts if the path really changes: skip unchanged paths
+                # (before normcasing anything) and case-only changes on case-insensitive filesystems
+                needs_conflict_check = (new_path != old_path and
+                                        os.path.normcase(old_path) != os.path.normcase(new_path))
                 
-                # Only check for conflicts if it's not a case-only change
-                if not is_case_only_change and os.path.exists(new_path) and new_path != old_path:
+                if needs_conflict_check and os.path.exists(new_path):
                     conflicts.append(f"Conflict: {new_path} already exists")
-                    continue
-                os.rename(old_path, new_path)
-                successes.append(op)
+                else:
+                    os.rename(old_path, new_path)
+                    successes.append(op)
             except Exception as e:
                 errors.append(f"Failed: {old_path} → {new_path} ({e})")
 
-            self.progress.emit(int(idx / total * 100))
+            self._report_progress(idx, total)
 
         self.finished.emit(successes, errors, conflicts)
@@ -13,6 +13,7 @@
 
 import os
 from PySide6.QtCore import QThread, Signal
+from app.utils.file_walk import iter_files
 
 
 class FileScanner(QThread):
@@ -23,10 +24,19 @@ class FileScanner(QThread):
         super().__init__()
         self.paths = paths
         self._abort = False
+        # Last emitted percentage; each change crosses to the GUI thread as a queued event
+        self._last_progress = -1
 
     def abort(self):
         self._abort = True
 
+    def _report_progress(self, done, total):
+        """Emit progress only when the whole percentage changes."""
+        percent = done * 100 // total
+        if percent != self._last_progress:
+            self._last_progress = percent
+            self.progress.emit(percent)
+
     def run(self):
         collected_files = []
         total = len(self.paths)
@@ -34,12 +44,11 @@ class FileScanner(QThread):
             if self._abort:
                 break
             if os.path.isdir(path):
-                for root, _, files in os.walk(path):
-                    for f in files:
-                        if self._abort:
-                            break
-                        collected_files.append(os.path.join(root, f))
+                for full_path in iter_files(path):
+                    if self._abort:
+                        break
+                    collected_files.append(full_path)
             else:
                 collected_files.append(path)
-            self.progress.emit(int(idx / total * 100))
+            self._report_progress(idx, total)
         self.finished.emit(collected_files)
@@ -47,10 +47,11 @@ if __name__ == "__main__":
     # Set application icon for taskbar/dock
     try:
         base = os.path.join(os.path.dirname(__file__), 'assets')
+        # One directory listing instead of an exists() check per candidate
+        available = set(os.listdir(base))
         for fname in ('app.ico', 'app.png', 'app.icns', 'app.svg'):
-            p = os.path.join(base, fname)
-            if os.path.exists(p):
-                app.setWindowIcon(QIcon(p))
+            if fname in available:
+                app.setWindowIcon(QIcon(os.path.join(base, fname)))
                 break
     except Exception:
         pass
@@ -39,6 +39,13 @@ def qt_app():
         app = QApplication(sys.argv)
     return app
 
+def _write_file(path, content, mtime=None):
+    """Create a small text file, optionally backdating its timestamps"""
+    path.write_text(content)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return str(path)
+
 @pytest.fixture
 def bulk_app(qt_app, tmp_path):
     """Provide a BulkRenamerApp with a temporary test folder"""
@@ -46,12 +53,8 @@ def bulk_app(qt_app, tmp_path):
     os.makedirs(test_dir)
 
     filenames = ["file1.txt", "file2.txt", "image.jpg", "document.pdf"]
-    for f in filenames:
-        with open(os.path.join(test_dir, f), "w") as file:
-            file.write("test content")
-
     app = BulkRenamerApp()
-    app.selected_files = [os.path.join(test_dir, f) for f in filenames]
+    app.selected_files = [_write_file(test_dir / f, "test content") for f in filenames]
 
     yield app
 
@@ -61,29 +64,14 @@ def bulk_app_with_dates(qt_app, tmp_path):
     test_dir = tmp_path / "test_files"
     os.makedirs(test_dir)
 
-    # Create files with different creation dates
-    filenames = ["old_file.txt", "recent_file.jpg", "very_old_file.pdf"]
-    
-    # Create old file (1 year ago)
-    old_file = os.path.join(test_dir, "old_file.txt")
-    with open(old_file, "w") as file:
-        file.write("old content")
-    old_time = (datetime.now() - timedelta(days=365)).timestamp()
-    os.utime(old_file, (old_time, old_time))
-    
-    # Create recent file (1 day ago)
-    recent_file = os.path.join(test_dir, "recent_file.jpg")
-    with open(recent_file, "w") as file:
-        file.write("recent content")
-    recent_time = (datetime.now() - timedelta(days=1)).timestamp()
-    os.utime(recent_file, (recent_time, recent_time))
-    
-    # Create very old file (2 years ago)
-    very_old_file = os.path.join(test_dir, "very_old_file.pdf")
-    with open(very_old_file, "w") as file:
-        file.write("very old content")
-    very_old_time = (datetime.now() - timedelta(days=730)).timestamp()
-    os.utime(very_old_file, (very_old_time, very_old_time))
+    now = datetime.now()
+    # Create files with different creation dates (1 year, 1 day and 2 years ago)
+    old_file = _write_file(test_dir / "old_file.txt", "old content",
+                           (now - timedelta(days=365)).timestamp())
+    recent_file = _write_file(test_dir / "recent_file.jpg", "recent content",
+                              (now - timedelta(days=1)).timestamp())
+    very_old_file = _write_file(test_dir / "very_old_file.pdf", "very old content",
+                                (now - timedelta(days=730)).timestamp())
 
     app = BulkRenamerApp()
     app.selected_files = [old_file, recent_file, very_old_file]
@@ -487,3 +487,22 @@ class TestFileAddWorker:
         
         assert len(added_files) == 3  # All nested files should be found
         assert duplicate_count == 0
+
+    @pytest.mark.skipif(not hasattr(os, "symlink") or sys.platform == "win32",
+                        reason="Directory symlinks need privileges on Windows")
+    def test_directory_symlink_not_followed(self, temp_dir):
+        """Test that symlinked directories are not descended into, like os.walk."""
+        real_dir = os.path.join(temp_dir, "real")
+        os.makedirs(real_dir)
+        real_file = os.path.join(real_dir, "inside.txt")
+        with open(real_file, 'w') as f:
+            f.write("content")
+        os.symlink(real_dir, os.path.join(temp_dir, "linked"))
+        
+        worker = FileAddWorker([temp_dir])
+        
+        added_files = []
+        worker.finished.connect(lambda files, duplicates: added_files.extend(files))
+        worker.run()  # Same thread, so the signal is delivered directly
+        
+        assert added_files == [os.path.normpath(real_file)]
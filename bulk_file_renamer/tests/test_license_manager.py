@@ -0,0 +1,42 @@
+# Copyright (c) 2024 Dominic Ritzmann. All rights reserved.
+# 
+# This software is licensed under the Bulk File Renamer License.
+# See LICENSE file for full license terms.
+# 
+# You may use this software for personal and professional purposes, including
+# using it to organize and rename files as part of your business or selling
+# files that have been processed using this software.
+# 
+# However, you may NOT modify, alter, or create derivative works of this software,
+# or sell, distribute, or license this software itself without explicit written
+# permission from the copyright holder.
+
+# tests/test_license_manager.py
+"""
+Tests for license key generation and validation.
+"""
+
+import sys
+import os
+
+# Ensure imports work
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from app.utils.license_manager import generate_license_key, validate_license_key
+
+
+class TestLicenseKeys:
+    """Test the license key helpers."""
+
+    def test_generate_license_key_format_is_stable(self):
+        """Keys must keep the truncated SHA-256 format that issued licenses use."""
+        assert generate_license_key("0123456789ab") == "2DBB294AF0358B55"
+
+    def test_validate_issued_license_key(self):
+        """An issued key validates for its machine, in any letter case."""
+        assert validate_license_key("2DBB294AF0358B55", "0123456789ab") == True
+        assert validate_license_key("2dbb294af0358b55", "0123456789ab") == True
+
+    def test_validate_license_key_rejects_other_machine(self):
+        """A key issued for one machine is rejected on another."""
+        assert validate_license_key("2DBB294AF0358B55", "ba9876543210") == False
+        assert validate_license_key("0000000000000000", "0123456789ab") == False
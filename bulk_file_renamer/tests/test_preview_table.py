@@ -0,0 +1,174 @@
+# Copyright (c) 2024 Dominic Ritzmann. All rights reserved.
+# 
+# This software is licensed under the Bulk File Renamer License.
+# See LICENSE file for full license terms.
+# 
+# You may use this software for personal and professional purposes, including
+# using it to organize and rename files as part of your business or selling
+# files that have been processed using this software.
+# 
+# However, you may NOT modify, alter, or create derivative works of this software,
+# or sell, distribute, or license this software itself without explicit written
+# permission from the copyright holder.
+
+# tests/test_preview_table.py
+"""
+Tests for the preview table model and its delegates.
+"""
+
+import sys
+import os
+import pytest
+from PySide6.QtCore import Qt, QPoint, QPointF, QRect, QEvent
+from PySide6.QtGui import QColor, QMouseEvent
+from PySide6.QtWidgets import QApplication, QStyleOptionViewItem
+
+# Ensure imports work
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from app.bulk_renamer_app import BulkRenamerApp
+from app.ui.preview_table import PreviewModel, SuggestionDelegate
+from app.utils.generate_preview import Status
+
+LABELS = ("Ready", "Conflict", "No Change", "Extension Locked")
+TOOLTIPS = ("ready tip", "conflict tip", "no change tip", "locked tip")
+
+
+@pytest.fixture(scope="module")
+def qt_app():
+    """Ensure a QApplication exists"""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+def _make_model(count, statuses=None, suggestions=None):
+    old_names = [f"file{i}.txt" for i in range(count)]
+    new_names = [f"new{i}.txt" for i in range(count)]
+    paths = [f"/tmp/file{i}.txt" for i in range(count)]
+    if statuses is None:
+        statuses = [Status.READY] * count
+    model = PreviewModel()
+    model.set_rows(old_names, new_names, statuses, paths, suggestions)
+    return model
+
+
+def _release(pos):
+    return QMouseEvent(QEvent.MouseButtonRelease, QPointF(pos), QPointF(pos),
+                       Qt.LeftButton, Qt.NoButton, Qt.NoModifier)
+
+
+def test_rows_are_fetched_in_batches(qt_app):
+    """Only the first batch is exposed; fetchMore adds the rest batch by batch"""
+    total = PreviewModel._FETCH_BATCH * 2 + 5
+    model = _make_model(total)
+
+    assert model.rowCount() == PreviewModel._FETCH_BATCH
+    assert model.columnCount() == 3
+    assert model.canFetchMore()
+
+    model.fetchMore()
+    assert model.rowCount() == PreviewModel._FETCH_BATCH * 2
+    model.fetchMore()
+    assert model.rowCount() == total
+    assert not model.canFetchMore()
+
+    # Nothing left to fetch: a further call is a no-op
+    model.fetchMore()
+    assert model.rowCount() == total
+
+
+def test_small_preview_is_fully_fetched(qt_app):
+    """A preview smaller than a batch is shown at once, and a reset starts over"""
+    model = _make_model(3)
+    assert model.rowCount() == 3
+    assert not model.canFetchMore()
+
+    model.set_rows([], [], [], [])
+    assert model.rowCount() == 0
+    assert not model.canFetchMore()
+
+
+def test_role_data_per_status(qt_app):
+    """Each status maps to its label, new-name color and tooltip"""
+    statuses = [Status.READY, Status.CONFLICT, Status.NO_CHANGE, Status.EXT_LOCKED]
+    model = _make_model(4, statuses)
+    model.set_status_text(LABELS, TOOLTIPS)
+    colors = (QColor("green"), QColor("red"), QColor("red"), QColor("#FF8C00"))
+
+    for row, status in enumerate(statuses):
+        assert model.data(model.index(row, 0)) == f"file{row}.txt"
+        assert model.data(model.index(row, 1)) == f"new{row}.txt"
+        assert model.data(model.index(row, 2)) == LABELS[status]
+        assert model.data(model.index(row, 1), Qt.ForegroundRole).color() == colors[status]
+        assert model.data(model.index(row, 1), Qt.ToolTipRole) == TOOLTIPS[status]
+        assert model.data(model.index(row, 2), PreviewModel.STATUS_ROLE) == status
+        assert model.data(model.index(row, 0), Qt.UserRole) == f"/tmp/file{row}.txt"
+        # Only the new-name column is colored and has a tooltip
+        assert model.data(model.index(row, 0), Qt.ForegroundRole) is None
+        assert model.data(model.index(row, 2), Qt.ToolTipRole) is None
+
+
+def test_tooltips_can_be_disabled(qt_app):
+    """Without tooltips the labels are still set"""
+    model = _make_model(1, [Status.CONFLICT])
+    model.set_status_text(LABELS)
+    assert model.data(model.index(0, 2)) == "Conflict"
+    assert model.data(model.index(0, 1), Qt.ToolTipRole) is None
+
+
+def test_suggestion_role_data(qt_app):
+    """A row with a suggestion carries it and crosses out the generated name"""
+    model = _make_model(2, [Status.CONFLICT, Status.CONFLICT], {0: "new0 (1).txt"})
+
+    assert model.data(model.index(0, 1), PreviewModel.SUGGESTION_ROLE) == "new0 (1).txt"
+    assert model.data(model.index(0, 1), Qt.FontRole).strikeOut()
+    assert model.data(model.index(1, 1), PreviewModel.SUGGESTION_ROLE) is None
+    assert model.data(model.index(1, 1), Qt.FontRole) is None
+
+
+def test_suggestion_delegate_buttons(qt_app):
+    """Releasing over the accept/decline buttons emits the row; other clicks pass through"""
+    model = _make_model(2, [Status.CONFLICT, Status.CONFLICT], {1: "new1 (1).txt"})
+    delegate = SuggestionDelegate()
+    accepted, declined = [], []
+    delegate.accepted.connect(accepted.append)
+    delegate.declined.connect(declined.append)
+
+    option = QStyleOptionViewItem()
+    option.rect = QRect(0, 0, 300, 30)
+    accept_rect, decline_rect = delegate._button_rects(option.rect)
+    index = model.index(1, 1)
+
+    assert delegate.button_at(index, option.rect, accept_rect.center()) == "accept"
+    assert delegate.button_at(index, option.rect, decline_rect.center()) == "decline"
+    assert delegate.button_at(index, option.rect, QPoint(5, 15)) is None
+    # Rows without a suggestion have no buttons
+    assert delegate.button_at(model.index(0, 1), option.rect, accept_rect.center()) is None
+
+    assert delegate.editorEvent(_release(accept_rect.center()), model, option, index)
+    assert delegate.editorEvent(_release(decline_rect.center()), model, option, index)
+    assert accepted == [1]
+    assert declined == [1]
+
+
+def test_accept_and_decline_suggestion(qt_app):
+    """Accepting takes the suggested name; declining keeps the generated one"""
+    app = BulkRenamerApp()
+    panel = app.top_panel
+    panel.update_preview([
+        ("a.txt", "b.txt", "Conflict|b (1).txt", "/tmp/a.txt"),
+        ("c.txt", "d.txt", "Conflict|d (1).txt", "/tmp/c.txt"),
+    ])
+    model = panel.table.model()
+    delegate = panel.table.suggestion_delegate
+
+    delegate.accepted.emit(0)
+    assert model.data(model.index(0, 1)) == "b (1).txt"
+    assert model.data(model.index(0, 2), PreviewModel.STATUS_ROLE) == Status.READY
+    assert model.data(model.index(0, 1), PreviewModel.SUGGESTION_ROLE) is None
+
+    delegate.declined.emit(1)
+    assert model.data(model.index(1, 1)) == "d.txt"
+    assert model.data(model.index(1, 2), PreviewModel.STATUS_ROLE) == Status.CONFLICT
+    assert model.data(model.index(1, 1), PreviewModel.SUGGESTION_ROLE) is None
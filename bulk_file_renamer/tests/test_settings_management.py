@@ -342,6 +342,23 @@ class TestSettingsManager:
         assert manager2.get("test_setting") == "persistent_value"
         assert manager2.get("preview_auto_refresh") == False
 
+    def test_autosave_coalesces_changes(self, temp_settings_file):
+        """Test that autosave writes a burst of changes once, after the delay."""
+        manager = SettingsManager(temp_settings_file, autosave_delay=0.5)
+        manager.set("test_setting", "first")
+        manager.set("test_setting", "second")
+        manager.add_recent_folder("/path/to/folder")
+        pending_save = manager._save_timer
+        
+        assert not os.path.exists(temp_settings_file)
+        pending_save.join(5.0)
+        
+        with open(temp_settings_file, 'r') as f:
+            saved_data = json.load(f)
+        assert saved_data["test_setting"] == "second"
+        assert saved_data["recent_folders"] == ["/path/to/folder"]
+        assert not os.path.exists(temp_settings_file + ".tmp")
+
     def test_settings_merge_with_defaults(self, temp_settings_file):
         """Test that loaded settings are merged with defaults."""
         # Create a settings file with only some settings
@@ -0,0 +1,115 @@
+# Copyright (c) 2024 Dominic Ritzmann. All rights reserved.
+# 
+# This software is licensed under the Bulk File Renamer License.
+# See LICENSE file for full license terms.
+# 
+# You may use this software for personal and professional purposes, including
+# using it to organize and rename files as part of your business or selling
+# files that have been processed using this software.
+# 
+# However, you may NOT modify, alter, or create derivative works of this software,
+# or sell, distribute, or license this software itself without explicit written
+# permission from the copyright holder.
+
+# tests/test_translation_manager.py
+"""
+Tests for translation lookup, English fallback and lazy language loading.
+"""
+
+import sys
+import os
+import json
+import pytest
+
+# Add the parent directory to the path for imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.utils.translation_manager import TranslationManager
+
+EN = {
+    "app": {"title": "Bulk File Renamer", "greeting": "Hello {name}"},
+    "menu": {"file": "File", "edit": "Edit", "only_en": "English only"},
+    "odd": {"dotted.name": "unreachable", "empty": None},
+    "settings": {"advanced": {"languages": {"en": "English", "de": "Deutsch"}}},
+}
+DE = {
+    "app": {"title": "Massen-Umbenenner", "greeting": "Hallo {name}"},
+    "menu": {"file": "Datei", "edit": "Bearbeiten"},
+    "odd": {"empty": None},
+}
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Provide a TranslationManager over a temporary English/German languages folder"""
+    for code, data in (("en", EN), ("de", DE)):
+        (tmp_path / f"{code}.json").write_text(json.dumps(data), encoding="utf-8")
+    return TranslationManager(str(tmp_path))
+
+
+def test_available_languages_from_english_names(manager):
+    """Language names come from English without parsing the other files"""
+    assert manager.get_available_languages() == {"en": "English", "de": "Deutsch"}
+    assert "de" not in manager.translations
+
+
+def test_set_language_loads_file_on_first_use(manager):
+    """A language not parsed at startup is loaded when it is selected"""
+    assert manager.set_language("de")
+    assert "de" in manager.translations
+    assert manager.get_language() == "de"
+    assert manager.tr("app.title") == "Massen-Umbenenner"
+    assert not manager.set_language("fr")
+    assert manager.get_language() == "de"
+
+
+def test_switching_language_clears_cached_lookups(manager):
+    """Lookups cached for one language are not reused for another"""
+    assert manager.tr("menu.file") == "File"
+    manager.set_language("de")
+    assert manager.tr("menu.file") == "Datei"
+    manager.set_language("en")
+    assert manager.tr("menu.file") == "File"
+
+
+def test_section_key_returns_section_text(manager):
+    """A key naming a section resolves to the section, as the nested lookup did"""
+    assert manager.tr("menu") == str(EN["menu"])
+
+
+def test_dotted_names_are_not_addressable(manager):
+    """Names containing a dot can't be reached with dot notation"""
+    assert manager.tr("odd.dotted.name") == "odd.dotted.name"
+    assert manager.tr("odd.dotted") == "odd.dotted"
+
+
+def test_missing_key_falls_back_to_english(manager):
+    """A key missing from German is taken from English, then the key itself is returned"""
+    manager.set_language("de")
+    assert manager.tr("menu.only_en") == "English only"
+    assert manager.tr("menu.missing") == "menu.missing"
+    assert manager.tr("missing") == "missing"
+
+
+def test_none_value_returns_key(manager):
+    """A key present with a None value returns the key, without falling back"""
+    assert manager.tr("odd.empty") == "odd.empty"
+    manager.set_language("de")
+    assert manager.tr("odd.empty") == "odd.empty"
+
+
+def test_format_kwargs(manager):
+    """Format parameters are applied; bad placeholders leave the text unformatted"""
+    assert manager.tr("app.greeting", name="Ada") == "Hello Ada"
+    assert manager.tr("app.greeting", other="x") == "Hello {name}"
+    manager.set_language("de")
+    assert manager.tr("app.greeting", name="Ada") == "Hallo Ada"
+
+
+@pytest.mark.parametrize("language", ["en", "de"])
+def test_tr_many_matches_translate(manager, language):
+    """tr_many gives the same text as translate for every kind of key"""
+    manager.set_language(language)
+    keys = ["app.title", "menu.file", "menu.edit", "menu.only_en", "menu.missing",
+            "odd.empty", "odd.dotted.name", "missing", "settings.advanced.languages.de"]
+    assert manager.tr_many(keys) == {key: manager.translate(key) for key in keys}